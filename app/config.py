@@ -31,6 +31,9 @@ class ModelConfig:
     max_tokens: int
     description: str
     supports_web_search: bool = False
+    # Reliably answers several ICPs in one multi-item JSON response
+    # (opt-in; other models get one pain taxonomy call per ICP)
+    supports_batching: bool = False
 
 
 # Available models via OpenRouter (using actual OpenRouter model IDs)
@@ -54,7 +57,8 @@ AVAILABLE_MODELS: Dict[str, ModelConfig] = {
         input_price_per_million=3.00,
         output_price_per_million=15.00,
         max_tokens=8192,
-        description="Advanced reasoning and analysis"
+        description="Advanced reasoning and analysis",
+        supports_batching=True
     ),
     "google/gemini-1.5-flash": ModelConfig(
         id="google/gemini-1.5-flash",
@@ -72,7 +76,8 @@ AVAILABLE_MODELS: Dict[str, ModelConfig] = {
         input_price_per_million=0.15,
         output_price_per_million=0.60,
         max_tokens=16384,
-        description="Efficient general-purpose model"
+        description="Efficient general-purpose model",
+        supports_batching=True
     ),
     "openai/gpt-4o": ModelConfig(
         id="openai/gpt-4o",
@@ -81,7 +86,8 @@ AVAILABLE_MODELS: Dict[str, ModelConfig] = {
         input_price_per_million=2.50,
         output_price_per_million=10.00,
         max_tokens=8192,
-        description="High-quality reasoning and generation"
+        description="High-quality reasoning and generation",
+        supports_batching=True
     ),
     "x-ai/grok-beta": ModelConfig(
         id="x-ai/grok-beta",
@@ -148,11 +154,24 @@ APP_CONFIG = {
     "default_num_icps": 3,
     "min_icps": 2,
     "max_icps": 5,
+    "default_batch_size": 2,  # ICPs per batched pain taxonomy call
+    "max_batch_size": 8,
+    # Output tokens reserved per ICP in a batched pain taxonomy call; also
+    # caps the batch at the model's max_tokens // this
+    "pain_taxonomy_tokens_per_icp": 4096,
     
     # API settings
     "openrouter_base_url": "https://openrouter.ai/api/v1",
     "request_timeout": 120,  # seconds
     "max_retries": 3,
+    "max_connections": 40,
+    "max_keepalive_connections": 20,
+    "max_concurrency": 10,  # parallel per-ICP analysis calls
+    
+    # LLM response cache (only for low-temperature, deterministic calls)
+    "llm_cache_dir": ".cache/llm",
+    "llm_cache_ttl": 7 * 24 * 60 * 60,  # seconds
+    "llm_cache_max_temperature": 0.3,
     
     # Export settings
     "export_formats": ["markdown", "docx"],
@@ -19,7 +19,8 @@ from app.models.research_models import (
     Motivation,
     PainPoint,
     DecisionStyle,
-    RiskTolerance
+    RiskTolerance,
+    parse_list
 )
 from app.llm.openrouter_client import OpenRouterClient
 
@@ -387,28 +388,27 @@ class AudienceResearchModule:
             objections=behav_data.get("objections", [])
         )
         
-        # Parse motivations
-        motivations = []
-        for m in data.get("motivations", []):
-            motivations.append(
-                Motivation(
-                    statement=m.get("statement", ""),
-                    category=m.get("category", "functional"),
-                    intensity=m.get("intensity", 5)
-                )
-            )
+        # Parse motivations (validated as one batch; Motivation is a
+        # plain dataclass, so the ICP won't re-validate them)
+        motivations = parse_list(Motivation, [
+            {
+                "statement": m.get("statement", ""),
+                "category": m.get("category", "functional"),
+                "intensity": m.get("intensity", 5)
+            }
+            for m in data.get("motivations", [])
+        ])
         
         # Parse pain points
-        pain_points = []
-        for p in data.get("pain_points", []):
-            pain_points.append(
-                PainPoint(
-                    statement=p.get("statement", ""),
-                    category=p.get("category", "functional"),
-                    severity=p.get("severity", 5),
-                    current_coping=p.get("current_coping")
-                )
-            )
+        pain_points = parse_list(PainPoint, [
+            {
+                "statement": p.get("statement", ""),
+                "category": p.get("category", "functional"),
+                "severity": p.get("severity", 5),
+                "current_coping": p.get("current_coping")
+            }
+            for p in data.get("pain_points", [])
+        ])
         
         return ICP(
             icp_name=data.get("icp_name", "Unnamed ICP"),
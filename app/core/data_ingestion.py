@@ -14,7 +14,8 @@ from app.models.research_models import (
     CompanyProfile,
     ProductService,
     Competitor,
-    BusinessModelType
+    BusinessModelType,
+    parse_list
 )
 from app.llm.openrouter_client import OpenRouterClient
 
@@ -386,47 +387,44 @@ class DataIngestionModule:
             return self._fallback_parse(client_input)
         
         # Parse products/services
-        products_services = []
-        for ps in company_data.get("products_services", []):
-            products_services.append(
-                ProductService(
-                    name=ps.get("name", "Unknown"),
-                    description=ps.get("description", ""),
-                    features=ps.get("features", []),
-                    target_audience=ps.get("target_audience"),
-                    unique_aspects=ps.get("unique_aspects", [])
-                )
-            )
+        products_services = parse_list(ProductService, [
+            {
+                "name": ps.get("name", "Unknown"),
+                "description": ps.get("description", ""),
+                "features": ps.get("features", []),
+                "target_audience": ps.get("target_audience"),
+                "unique_aspects": ps.get("unique_aspects", [])
+            }
+            for ps in company_data.get("products_services", [])
+        ])
         
         # Parse competitors
         competitors = []
         
         # From company research
         for comp in company_data.get("competitors", []):
-            competitors.append(
-                Competitor(
-                    name=comp.get("name", "Unknown"),
-                    description=comp.get("description"),
-                    key_differentiators=comp.get("key_differentiators", [])
-                )
-            )
+            competitors.append({
+                "name": comp.get("name", "Unknown"),
+                "description": comp.get("description"),
+                "key_differentiators": comp.get("key_differentiators", [])
+            })
         
         # From competitor research
         for comp in competitor_data.get("direct_competitors", []):
             # Avoid duplicates
-            if not any(c.name == comp.get("name") for c in competitors):
-                competitors.append(
-                    Competitor(
-                        name=comp.get("name", "Unknown"),
-                        website=comp.get("website"),
-                        description=comp.get("description"),
-                        key_differentiators=comp.get(
-                            "key_differentiators", []
-                        ),
-                        target_audience=comp.get("target_audience"),
-                        market_position=comp.get("market_position")
-                    )
-                )
+            if not any(c["name"] == comp.get("name") for c in competitors):
+                competitors.append({
+                    "name": comp.get("name", "Unknown"),
+                    "website": comp.get("website"),
+                    "description": comp.get("description"),
+                    "key_differentiators": comp.get(
+                        "key_differentiators", []
+                    ),
+                    "target_audience": comp.get("target_audience"),
+                    "market_position": comp.get("market_position")
+                })
+        
+        competitors = parse_list(Competitor, competitors)
         
         # Parse business model
         bm_str = company_data.get("business_model", "").lower()
@@ -17,7 +17,8 @@ from app.models.research_models import (
     PainPointTaxonomy,
     CustomerJourneyMap,
     JourneyStage,
-    ContentIdea
+    ContentIdea,
+    parse_list
 )
 from app.llm.openrouter_client import OpenRouterClient
 
@@ -452,18 +453,18 @@ class JourneyMappingModule:
             if not stage_data:
                 return None
             
-            # Parse content ideas
-            content_ideas = []
-            for idea in stage_data.get("content_ideas", []):
-                content_ideas.append(
-                    ContentIdea(
-                        title=idea.get("title", ""),
-                        format=idea.get("format", "blog"),
-                        hook=idea.get("hook"),
-                        key_message=idea.get("key_message"),
-                        cta=idea.get("cta")
-                    )
-                )
+            # Parse content ideas (validated as one batch; ContentIdea is a
+            # plain dataclass, so the stage won't re-validate them)
+            content_ideas = parse_list(ContentIdea, [
+                {
+                    "title": idea.get("title", ""),
+                    "format": idea.get("format", "blog"),
+                    "hook": idea.get("hook"),
+                    "key_message": idea.get("key_message"),
+                    "cta": idea.get("cta")
+                }
+                for idea in stage_data.get("content_ideas", [])
+            ])
             
             # Extract customer state
             state = stage_data.get("customer_state", {})
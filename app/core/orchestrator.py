@@ -7,9 +7,11 @@ and aggregating results into the final ResearchResults object.
 
 import json
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Callable, Optional, Dict, Any, List
 
 from app.config import (
+    AVAILABLE_MODELS,
     PERPLEXITY_RESEARCH_MODEL,
     PIPELINE_STAGES,
     APP_CONFIG
@@ -22,7 +24,8 @@ from app.models.research_models import (
     ValuePropositionCanvas,
     PainPointTaxonomy,
     CustomerJourneyMap,
-    ICPAnalysisResult
+    ICPAnalysisResult,
+    build_schemas
 )
 from app.llm.openrouter_client import OpenRouterClient, CostTracker
 
@@ -51,12 +54,18 @@ class ResearchOrchestrator:
     3. USP Extraction - Map value propositions for each ICP
     4. Pain Taxonomy - Deep pain point analysis for each ICP
     5. Journey Mapping - Create customer journey maps for each ICP
+    
+    Stages 3 and 4 are independent and run concurrently across all ICPs;
+    each ICP's journey map starts as soon as its own USP and pain results
+    are in. Pain taxonomies are requested batch_size ICPs per LLM call.
     """
     
     def __init__(
         self,
         analysis_model: str,
-        cost_tracker: Optional[CostTracker] = None
+        cost_tracker: Optional[CostTracker] = None,
+        max_concurrency: Optional[int] = None,
+        batch_size: Optional[int] = None
     ):
         """
         Initialize the orchestrator.
@@ -64,13 +73,38 @@ class ResearchOrchestrator:
         Args:
             analysis_model: The model ID to use for analysis tasks
             cost_tracker: Optional cost tracker for token usage
+            max_concurrency: Max parallel per-ICP analysis calls
+                (defaults to APP_CONFIG["max_concurrency"])
+            batch_size: ICPs per batched pain taxonomy call; 1 disables
+                batching (defaults to APP_CONFIG["default_batch_size"];
+                always 1 for models without supports_batching, and capped
+                so the batch's output fits the model's max_tokens)
         """
         self.analysis_model = analysis_model
-        self.cost_tracker = cost_tracker or CostTracker()
+        self._cost_tracker = cost_tracker or CostTracker()
+        self.max_concurrency = max(
+            1, max_concurrency or APP_CONFIG["max_concurrency"]
+        )
+        self.batch_size = max(
+            1, batch_size or APP_CONFIG["default_batch_size"]
+        )
+        model_config = AVAILABLE_MODELS.get(analysis_model)
+        if model_config and not model_config.supports_batching:
+            self.batch_size = 1
+        elif model_config:
+            # Keep each batch's output within the model's token limit
+            self.batch_size = min(self.batch_size, max(
+                1,
+                model_config.max_tokens
+                // APP_CONFIG["pain_taxonomy_tokens_per_icp"]
+            ))
+        
+        # Resolve the (deferred) model schemas before the pipeline runs
+        build_schemas()
         
         # Initialize the LLM client
         self.llm_client = OpenRouterClient(
-            cost_tracker=self.cost_tracker
+            cost_tracker=self._cost_tracker
         )
         
         # Initialize analysis modules
@@ -99,6 +133,27 @@ class ResearchOrchestrator:
             analysis_model=analysis_model
         )
     
+    @property
+    def cost_tracker(self) -> CostTracker:
+        """The cost tracker that LLM usage is logged to."""
+        return self._cost_tracker
+    
+    @cost_tracker.setter
+    def cost_tracker(self, cost_tracker: CostTracker):
+        """Swap the cost tracker, e.g. when reusing the orchestrator."""
+        self._cost_tracker = cost_tracker
+        self.llm_client.cost_tracker = cost_tracker
+    
+    @property
+    def use_cache(self) -> bool:
+        """Whether deterministic LLM calls go through the response cache."""
+        return self.llm_client.use_cache
+    
+    @use_cache.setter
+    def use_cache(self, use_cache: bool):
+        """Toggle the LLM response cache, e.g. per session."""
+        self.llm_client.use_cache = use_cache
+    
     def run_research(
         self,
         client_input: ClientInput,
@@ -176,84 +231,9 @@ class ResearchOrchestrator:
                 raise
             
             # ===== Stages 3-5: Per-ICP Analysis =====
-            for i, icp in enumerate(icps):
-                icp_result = ICPAnalysisResult(icp=icp)
-                
-                # Stage 3: USP Extraction
-                stage_id = f"usp_extraction_{i+1}"
-                update_progress(stage_id, "running")
-                
-                try:
-                    vp_canvas = self.usp_extraction.run(
-                        client_input=client_input,
-                        company_profile=company_profile,
-                        icp=icp
-                    )
-                    icp_result.value_proposition = vp_canvas
-                    update_progress(
-                        stage_id,
-                        "complete",
-                        data={"fit_score": vp_canvas.fit_score}
-                    )
-                except Exception as e:
-                    update_progress(stage_id, "error", error=str(e))
-                    logger.warning(
-                        f"USP extraction failed for ICP {i+1}: {e}"
-                    )
-                
-                # Stage 4: Pain Taxonomy
-                stage_id = f"pain_taxonomy_{i+1}"
-                update_progress(stage_id, "running")
-                
-                try:
-                    pain_tax = self.pain_taxonomy.run(
-                        client_input=client_input,
-                        company_profile=company_profile,
-                        icp=icp
-                    )
-                    icp_result.pain_taxonomy = pain_tax
-                    update_progress(
-                        stage_id,
-                        "complete",
-                        data={
-                            "num_pains": (
-                                len(pain_tax.functional_pains) +
-                                len(pain_tax.financial_pains) +
-                                len(pain_tax.emotional_pains)
-                            )
-                        }
-                    )
-                except Exception as e:
-                    update_progress(stage_id, "error", error=str(e))
-                    logger.warning(
-                        f"Pain taxonomy failed for ICP {i+1}: {e}"
-                    )
-                
-                # Stage 5: Journey Mapping
-                stage_id = f"journey_mapping_{i+1}"
-                update_progress(stage_id, "running")
-                
-                try:
-                    journey = self.journey_mapping.run(
-                        client_input=client_input,
-                        company_profile=company_profile,
-                        icp=icp,
-                        value_proposition=icp_result.value_proposition,
-                        pain_taxonomy=icp_result.pain_taxonomy
-                    )
-                    icp_result.journey_map = journey
-                    update_progress(
-                        stage_id,
-                        "complete",
-                        data={"stages": 5}
-                    )
-                except Exception as e:
-                    update_progress(stage_id, "error", error=str(e))
-                    logger.warning(
-                        f"Journey mapping failed for ICP {i+1}: {e}"
-                    )
-                
-                icp_results.append(icp_result)
+            icp_results = self._run_icp_analysis(
+                client_input, company_profile, icps, update_progress
+            )
             
             # ===== Compile Final Results =====
             results = ResearchResults(
@@ -284,6 +264,223 @@ class ResearchOrchestrator:
                 error=str(e)
             )
     
+    def _run_icp_analysis(
+        self,
+        client_input: ClientInput,
+        company_profile: CompanyProfile,
+        icps: List[ICP],
+        update_progress: Callable[..., None]
+    ) -> List[ICPAnalysisResult]:
+        """
+        Run USP extraction, pain taxonomy and journey mapping for every ICP.
+        
+        All calls share one pool bounded by max_concurrency. Rate-limit
+        (429) responses are retried with backoff by the LLM client.
+        
+        Returns:
+            One ICPAnalysisResult per ICP, in the same order as icps
+        """
+        icp_results = [ICPAnalysisResult(icp=icp) for icp in icps]
+        
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="icp-analysis"
+        ) as pool:
+            # Stages 3 and 4 only depend on the ICP itself
+            usp_futures = [
+                pool.submit(
+                    self._run_usp_extraction,
+                    i, client_input, company_profile, icp, update_progress
+                )
+                for i, icp in enumerate(icps)
+            ]
+            # (future, index within its batch) for each ICP
+            pain_futures = []
+            for start in range(0, len(icps), self.batch_size):
+                batch = icps[start:start + self.batch_size]
+                future = pool.submit(
+                    self._run_pain_taxonomy_batch,
+                    start, client_input, company_profile, batch,
+                    update_progress
+                )
+                pain_futures.extend((future, j) for j in range(len(batch)))
+            
+            # ICPs a batch couldn't answer are retried individually on the
+            # pool, all of a batch's retries submitted as soon as it resolves
+            retries: Dict[Future, list] = {}
+            
+            def pain_result(i: int) -> Optional[PainPointTaxonomy]:
+                future, j = pain_futures[i]
+                if future not in retries:
+                    taxonomies = future.result()
+                    start = i - j
+                    retries[future] = [
+                        pool.submit(
+                            self._run_pain_taxonomy,
+                            start + k, client_input, company_profile,
+                            icps[start + k], update_progress
+                        )
+                        if pain_tax is None and len(taxonomies) > 1
+                        else pain_tax
+                        for k, pain_tax in enumerate(taxonomies)
+                    ]
+                item = retries[future][j]
+                return item.result() if isinstance(item, Future) else item
+            
+            # Stage 5 needs both results for its ICP
+            journey_futures = []
+            for i, icp_result in enumerate(icp_results):
+                icp_result.value_proposition = usp_futures[i].result()
+                icp_result.pain_taxonomy = pain_result(i)
+                journey_futures.append(pool.submit(
+                    self._run_journey_mapping,
+                    i, client_input, company_profile, icp_result,
+                    update_progress
+                ))
+            
+            for icp_result, future in zip(icp_results, journey_futures):
+                icp_result.journey_map = future.result()
+        
+        return icp_results
+    
+    def _run_usp_extraction(
+        self,
+        i: int,
+        client_input: ClientInput,
+        company_profile: CompanyProfile,
+        icp: ICP,
+        update_progress: Callable[..., None]
+    ) -> Optional[ValuePropositionCanvas]:
+        """Stage 3 for a single ICP; returns None on failure."""
+        stage_id = f"usp_extraction_{i+1}"
+        update_progress(stage_id, "running")
+        
+        try:
+            vp_canvas = self.usp_extraction.run(
+                client_input=client_input,
+                company_profile=company_profile,
+                icp=icp
+            )
+            update_progress(
+                stage_id,
+                "complete",
+                data={"fit_score": vp_canvas.fit_score}
+            )
+            return vp_canvas
+        except Exception as e:
+            update_progress(stage_id, "error", error=str(e))
+            logger.warning(f"USP extraction failed for ICP {i+1}: {e}")
+            return None
+    
+    def _run_pain_taxonomy(
+        self,
+        i: int,
+        client_input: ClientInput,
+        company_profile: CompanyProfile,
+        icp: ICP,
+        update_progress: Callable[..., None]
+    ) -> Optional[PainPointTaxonomy]:
+        """Stage 4 for a single ICP; returns None on failure."""
+        stage_id = f"pain_taxonomy_{i+1}"
+        update_progress(stage_id, "running")
+        
+        try:
+            pain_tax = self.pain_taxonomy.run(
+                client_input=client_input,
+                company_profile=company_profile,
+                icp=icp
+            )
+            update_progress(
+                stage_id,
+                "complete",
+                data={"num_pains": self._count_pains(pain_tax)}
+            )
+            return pain_tax
+        except Exception as e:
+            update_progress(stage_id, "error", error=str(e))
+            logger.warning(f"Pain taxonomy failed for ICP {i+1}: {e}")
+            return None
+    
+    def _run_pain_taxonomy_batch(
+        self,
+        start: int,
+        client_input: ClientInput,
+        company_profile: CompanyProfile,
+        icps: List[ICP],
+        update_progress: Callable[..., None]
+    ) -> List[Optional[PainPointTaxonomy]]:
+        """
+        Stage 4 for a batch of ICPs in one LLM call.
+        
+        Returns None for every ICP the batch couldn't answer (the whole
+        call failed, or its item was malformed); the caller retries those
+        individually on the shared pool. A single-ICP batch is just the
+        individual call, so its None is final.
+        """
+        if len(icps) == 1:
+            return [self._run_pain_taxonomy(
+                start, client_input, company_profile, icps[0],
+                update_progress
+            )]
+        
+        for j in range(len(icps)):
+            update_progress(f"pain_taxonomy_{start+j+1}", "running")
+        
+        try:
+            taxonomies = self.pain_taxonomy.run_batch(
+                client_input=client_input,
+                company_profile=company_profile,
+                icps=icps
+            )
+        except Exception as e:
+            logger.warning(
+                f"Batched pain taxonomy failed for ICPs "
+                f"{start+1}-{start+len(icps)}, retrying individually: {e}"
+            )
+            return [None] * len(icps)
+        
+        for j, pain_tax in enumerate(taxonomies):
+            if pain_tax is not None:
+                update_progress(
+                    f"pain_taxonomy_{start+j+1}",
+                    "complete",
+                    data={"num_pains": self._count_pains(pain_tax)}
+                )
+        
+        return taxonomies
+    
+    @staticmethod
+    def _count_pains(pain_tax: PainPointTaxonomy) -> int:
+        """Total number of pains across all three dimensions."""
+        return len(pain_tax.pains)
+    
+    def _run_journey_mapping(
+        self,
+        i: int,
+        client_input: ClientInput,
+        company_profile: CompanyProfile,
+        icp_result: ICPAnalysisResult,
+        update_progress: Callable[..., None]
+    ) -> Optional[CustomerJourneyMap]:
+        """Stage 5 for a single ICP; returns None on failure."""
+        stage_id = f"journey_mapping_{i+1}"
+        update_progress(stage_id, "running")
+        
+        try:
+            journey = self.journey_mapping.run(
+                client_input=client_input,
+                company_profile=company_profile,
+                icp=icp_result.icp,
+                value_proposition=icp_result.value_proposition,
+                pain_taxonomy=icp_result.pain_taxonomy
+            )
+            update_progress(stage_id, "complete", data={"stages": 5})
+            return journey
+        except Exception as e:
+            update_progress(stage_id, "error", error=str(e))
+            logger.warning(f"Journey mapping failed for ICP {i+1}: {e}")
+            return None
+    
     def run_stage(
         self,
         stage_id: str,
@@ -9,13 +9,17 @@ import json
 import logging
 from typing import Dict, Any, List, Optional
 
+from app.config import APP_CONFIG, get_model_config
 from app.models.research_models import (
     ClientInput,
     CompanyProfile,
     ICP,
     PainPointTaxonomy,
-    DetailedPainPoint,
-    ForcesOfProgressAnalysis
+    FunctionalPain,
+    FinancialPain,
+    EmotionalPain,
+    ForcesOfProgressAnalysis,
+    parse_list
 )
 from app.llm.openrouter_client import OpenRouterClient
 
@@ -23,7 +27,7 @@ from app.llm.openrouter_client import OpenRouterClient
 logger = logging.getLogger(__name__)
 
 
-PAIN_TAXONOMY_PROMPT = """
+PAIN_TAXONOMY_CONTEXT = """
 You are an expert in Jobs-to-be-Done (JTBD) theory and customer psychology.
 Your task is to create a comprehensive pain point taxonomy for a specific
 customer segment.
@@ -37,9 +41,9 @@ customer segment.
 **Company Value Proposition:**
 {value_proposition}
 
-## Target ICP Profile
+"""
 
-**ICP Name:** {icp_name}
+ICP_PROFILE_BLOCK = """**ICP Name:** {icp_name}
 **One-Liner:** {icp_one_liner}
 
 **Key Characteristics:**
@@ -50,7 +54,9 @@ customer segment.
 
 **Known Motivations:**
 {known_motivations}
+"""
 
+PAIN_TAXONOMY_TASK = """
 ## Your Task
 
 Create an exhaustive pain point taxonomy organized into three dimensions,
@@ -188,10 +194,25 @@ Analyze the balance of forces and recommend where to focus.
     ]
 }}
 ```
-
-Generate the comprehensive pain taxonomy now:
 """
 
+PAIN_TAXONOMY_PROMPT = (
+    PAIN_TAXONOMY_CONTEXT
+    + "## Target ICP Profile\n\n"
+    + ICP_PROFILE_BLOCK
+    + PAIN_TAXONOMY_TASK
+    + "\nGenerate the comprehensive pain taxonomy now:\n"
+)
+
+# Several ICPs share one copy of the company context and instructions; the
+# client's analyze_batch appends the numbered ICP profiles after it
+PAIN_TAXONOMY_BATCH_PREFIX = (
+    PAIN_TAXONOMY_CONTEXT
+    + PAIN_TAXONOMY_TASK
+    + "\nEach item below is one Target ICP Profile. Generate the "
+    + "comprehensive pain taxonomy for each, in the output format above.\n"
+)
+
 
 class PainTaxonomyModule:
     """
@@ -232,6 +253,113 @@ class PainTaxonomyModule:
         """
         logger.info(f"Creating pain taxonomy for ICP: {icp.icp_name}")
         
+        # Build the prompt
+        prompt = PAIN_TAXONOMY_PROMPT.format(
+            **self._format_company_fields(company_profile),
+            **self._format_icp_fields(icp)
+        )
+        
+        # Call the LLM
+        response = self.llm_client.analyze(
+            prompt=prompt,
+            model=self.analysis_model,
+            system_prompt=(
+                "You are a JTBD and customer psychology expert. "
+                "Return only valid JSON."
+            )
+        )
+        
+        # Parse response
+        taxonomy_data = self._extract_json(response.content)
+        
+        # Convert to taxonomy object
+        taxonomy = self._parse_taxonomy(taxonomy_data, icp)
+        
+        total_pains = len(taxonomy.pains)
+        
+        logger.info(
+            f"Pain taxonomy complete for {icp.icp_name}. "
+            f"Total pains: {total_pains}"
+        )
+        
+        return taxonomy
+    
+    def run_batch(
+        self,
+        client_input: ClientInput,
+        company_profile: CompanyProfile,
+        icps: List[ICP]
+    ) -> List[Optional[PainPointTaxonomy]]:
+        """
+        Generate pain taxonomies for several ICPs in a single LLM call.
+        
+        The company context and instructions are sent once as the shared
+        prefix of OpenRouterClient.analyze_batch, followed by the numbered
+        ICP profiles; the model returns one taxonomy per ICP in order.
+        
+        Args:
+            client_input: Original client input
+            company_profile: Parsed company profile
+            icps: The ICPs to analyze
+            
+        Returns:
+            One PainPointTaxonomy per ICP, in order. Entries whose batch item
+            was malformed are None so the caller can retry them individually.
+            
+        Raises:
+            ValueError: If the response does not contain one result per ICP
+        """
+        logger.info(f"Creating batched pain taxonomy for {len(icps)} ICPs")
+        
+        prefix = PAIN_TAXONOMY_BATCH_PREFIX.format(
+            **self._format_company_fields(company_profile)
+        )
+        icp_profiles = [
+            ICP_PROFILE_BLOCK.format(**self._format_icp_fields(icp))
+            for icp in icps
+        ]
+        
+        # Output budget grows with the batch, up to the model's limit
+        max_tokens = min(
+            APP_CONFIG["pain_taxonomy_tokens_per_icp"] * len(icps),
+            get_model_config(self.analysis_model).max_tokens
+        )
+        
+        # Raises ValueError unless the reply splits into len(icps) items
+        responses = self.llm_client.analyze_batch(
+            prompts=icp_profiles,
+            model=self.analysis_model,
+            system_prompt=(
+                "You are a JTBD and customer psychology expert. "
+                "Return only valid JSON."
+            ),
+            prefix=prefix,
+            max_tokens=max_tokens
+        )
+        
+        taxonomies: List[Optional[PainPointTaxonomy]] = []
+        for icp, response in zip(icps, responses):
+            item = json.loads(response.content)
+            if not isinstance(item, dict) or not any(
+                key in item
+                for key in (
+                    "functional_pains", "financial_pains", "emotional_pains"
+                )
+            ):
+                logger.warning(
+                    f"Malformed batched taxonomy for ICP: {icp.icp_name}"
+                )
+                taxonomies.append(None)
+                continue
+            taxonomies.append(self._parse_taxonomy(item, icp))
+        
+        return taxonomies
+    
+    @staticmethod
+    def _format_company_fields(
+        company_profile: CompanyProfile
+    ) -> Dict[str, str]:
+        """Format the company context placeholders of the prompt."""
         # Format solution category
         products = [ps.name for ps in company_profile.products_services]
         solution_category = ", ".join(products) or company_profile.industry
@@ -240,6 +368,16 @@ class PainTaxonomyModule:
         vp_list = company_profile.stated_value_propositions or []
         vp_str = "\n".join(f"- {vp}" for vp in vp_list) or "Not specified"
         
+        return {
+            "company_name": company_profile.name,
+            "industry": company_profile.industry,
+            "solution_category": solution_category,
+            "value_proposition": vp_str
+        }
+    
+    @staticmethod
+    def _format_icp_fields(icp: ICP) -> Dict[str, str]:
+        """Format the ICP profile placeholders of the prompt."""
         # Format ICP characteristics
         characteristics = [
             f"- Decision Style: {icp.psychographics.decision_style.value}",
@@ -271,47 +409,13 @@ class PainTaxonomyModule:
         ]
         motivations_str = "\n".join(motivations_list) or "None specified"
         
-        # Build the prompt
-        prompt = PAIN_TAXONOMY_PROMPT.format(
-            company_name=company_profile.name,
-            industry=company_profile.industry,
-            solution_category=solution_category,
-            value_proposition=vp_str,
-            icp_name=icp.icp_name,
-            icp_one_liner=icp.one_liner,
-            icp_characteristics=char_str,
-            known_pain_points=pains_str,
-            known_motivations=motivations_str
-        )
-        
-        # Call the LLM
-        response = self.llm_client.analyze(
-            prompt=prompt,
-            model=self.analysis_model,
-            system_prompt=(
-                "You are a JTBD and customer psychology expert. "
-                "Return only valid JSON."
-            )
-        )
-        
-        # Parse response
-        taxonomy_data = self._extract_json(response.content)
-        
-        # Convert to taxonomy object
-        taxonomy = self._parse_taxonomy(taxonomy_data, icp)
-        
-        total_pains = (
-            len(taxonomy.functional_pains) +
-            len(taxonomy.financial_pains) +
-            len(taxonomy.emotional_pains)
-        )
-        
-        logger.info(
-            f"Pain taxonomy complete for {icp.icp_name}. "
-            f"Total pains: {total_pains}"
-        )
-        
-        return taxonomy
+        return {
+            "icp_name": icp.icp_name,
+            "icp_one_liner": icp.one_liner,
+            "icp_characteristics": char_str,
+            "known_pain_points": pains_str,
+            "known_motivations": motivations_str
+        }
     
     def _extract_json(self, content: str) -> Dict[str, Any]:
         """Extract JSON from LLM response."""
@@ -359,52 +463,49 @@ class PainTaxonomyModule:
             return self._create_fallback_taxonomy(icp)
 
         # Parse functional pains
-        functional_pains = []
-        for p in data.get("functional_pains", []):
-            functional_pains.append(
-                DetailedPainPoint(
-                    statement=p.get("statement", ""),
-                    category=p.get("category", "inefficiency"),
-                    severity=p.get("severity", 5),
-                    frequency=p.get("frequency"),
-                    current_coping_mechanism=p.get("current_coping_mechanism"),
-                    impact_if_unresolved=p.get("impact_if_unresolved"),
-                    root_cause=p.get("root_cause"),
-                    five_whys_depth=p.get("five_whys_depth")
-                )
-            )
+        pains = parse_list(FunctionalPain, [
+            {
+                "statement": p.get("statement", ""),
+                "category": p.get("category", "inefficiency"),
+                "severity": p.get("severity", 5),
+                "frequency": p.get("frequency"),
+                "current_coping_mechanism": p.get("current_coping_mechanism"),
+                "impact_if_unresolved": p.get("impact_if_unresolved"),
+                "root_cause": p.get("root_cause"),
+                "five_whys_depth": p.get("five_whys_depth")
+            }
+            for p in data.get("functional_pains", [])
+        ])
         
         # Parse financial pains
-        financial_pains = []
-        for p in data.get("financial_pains", []):
-            financial_pains.append(
-                DetailedPainPoint(
-                    statement=p.get("statement", ""),
-                    category=p.get("category", "direct_cost"),
-                    severity=p.get("severity", 5),
-                    frequency=p.get("frequency"),
-                    current_coping_mechanism=p.get("current_coping_mechanism"),
-                    impact_if_unresolved=p.get("impact_if_unresolved"),
-                    root_cause=p.get("root_cause"),
-                    estimated_cost_impact=p.get("estimated_cost_impact")
-                )
-            )
+        pains += parse_list(FinancialPain, [
+            {
+                "statement": p.get("statement", ""),
+                "category": p.get("category", "direct_cost"),
+                "severity": p.get("severity", 5),
+                "frequency": p.get("frequency"),
+                "current_coping_mechanism": p.get("current_coping_mechanism"),
+                "impact_if_unresolved": p.get("impact_if_unresolved"),
+                "root_cause": p.get("root_cause"),
+                "estimated_cost_impact": p.get("estimated_cost_impact")
+            }
+            for p in data.get("financial_pains", [])
+        ])
         
         # Parse emotional pains
-        emotional_pains = []
-        for p in data.get("emotional_pains", []):
-            emotional_pains.append(
-                DetailedPainPoint(
-                    statement=p.get("statement", ""),
-                    category=p.get("category", "anxiety"),
-                    severity=p.get("severity", 5),
-                    frequency=p.get("frequency"),
-                    current_coping_mechanism=p.get("current_coping_mechanism"),
-                    impact_if_unresolved=p.get("impact_if_unresolved"),
-                    trigger_situations=p.get("trigger_situations", []),
-                    underlying_fear=p.get("underlying_fear")
-                )
-            )
+        pains += parse_list(EmotionalPain, [
+            {
+                "statement": p.get("statement", ""),
+                "category": p.get("category", "anxiety"),
+                "severity": p.get("severity", 5),
+                "frequency": p.get("frequency"),
+                "current_coping_mechanism": p.get("current_coping_mechanism"),
+                "impact_if_unresolved": p.get("impact_if_unresolved"),
+                "trigger_situations": p.get("trigger_situations", []),
+                "underlying_fear": p.get("underlying_fear")
+            }
+            for p in data.get("emotional_pains", [])
+        ])
         
         # Parse forces analysis
         forces_data = data.get("forces_analysis", {})
@@ -439,9 +540,7 @@ class PainTaxonomyModule:
         
         return PainPointTaxonomy(
             icp_name=icp.icp_name,
-            functional_pains=functional_pains,
-            financial_pains=financial_pains,
-            emotional_pains=emotional_pains,
+            pains=pains,
             forces_analysis=forces_analysis,
             pain_priority_ranking=data.get("pain_priority_ranking", []),
             messaging_implications=data.get("messaging_implications", [])
@@ -452,29 +551,28 @@ class PainTaxonomyModule:
         print(f"[PainTaxonomy] Creating fallback taxonomy from ICP data for: {icp.icp_name}")
 
         # Convert existing ICP pain points to detailed pain points
-        functional_pains = []
-        financial_pains = []
-        emotional_pains = []
+        pains = []
 
         for p in icp.pain_points:
-            detailed = DetailedPainPoint(
-                statement=p.statement,
-                category=p.category,
-                severity=p.severity,
-                frequency=p.frequency,
-                current_coping_mechanism=None,
-                impact_if_unresolved="Impact analysis unavailable due to processing error",
-                root_cause=None
-            )
             # Categorize based on category name
             if p.category in ["inefficiency", "complexity", "inaccuracy", "capability",
                              "interoperability", "scalability", "reliability", "functional"]:
-                functional_pains.append(detailed)
+                pain_cls = FunctionalPain
             elif p.category in ["direct_cost", "hidden_cost", "opportunity_cost",
                                "roi_uncertainty", "cash_flow", "resource_drain", "financial"]:
-                financial_pains.append(detailed)
+                pain_cls = FinancialPain
             else:
-                emotional_pains.append(detailed)
+                pain_cls = EmotionalPain
+            pains.append(
+                pain_cls(
+                    statement=p.statement,
+                    category=p.category,
+                    severity=p.severity,
+                    frequency=p.frequency,
+                    current_coping_mechanism=None,
+                    impact_if_unresolved="Impact analysis unavailable due to processing error"
+                )
+            )
 
         # Create basic forces analysis from psychographics
         forces_analysis = ForcesOfProgressAnalysis(
@@ -489,9 +587,7 @@ class PainTaxonomyModule:
 
         return PainPointTaxonomy(
             icp_name=icp.icp_name,
-            functional_pains=functional_pains,
-            financial_pains=financial_pains,
-            emotional_pains=emotional_pains,
+            pains=pains,
             forces_analysis=forces_analysis,
             pain_priority_ranking=[],
             messaging_implications=[
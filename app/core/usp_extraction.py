@@ -15,7 +15,8 @@ from app.models.research_models import (
     ICP,
     ValuePropositionCanvas,
     PainReliever,
-    GainCreator
+    GainCreator,
+    parse_list
 )
 from app.llm.openrouter_client import OpenRouterClient
 
@@ -334,32 +335,26 @@ class USPExtractionModule:
         """Parse VPC data into structured object."""
         
         # Parse pain relievers
-        pain_relievers = []
-        for pr in data.get("pain_relievers", []):
-            pain_relievers.append(
-                PainReliever(
-                    pain_addressed=pr.get("pain_addressed", ""),
-                    feature_or_capability=pr.get(
-                        "feature_or_capability", ""
-                    ),
-                    how_relieved=pr.get("how_relieved", ""),
-                    relief_significance=pr.get("relief_significance", 5)
-                )
-            )
+        pain_relievers = parse_list(PainReliever, [
+            {
+                "pain_addressed": pr.get("pain_addressed", ""),
+                "feature_or_capability": pr.get("feature_or_capability", ""),
+                "how_relieved": pr.get("how_relieved", ""),
+                "relief_significance": pr.get("relief_significance", 5)
+            }
+            for pr in data.get("pain_relievers", [])
+        ])
         
         # Parse gain creators
-        gain_creators = []
-        for gc in data.get("gain_creators", []):
-            gain_creators.append(
-                GainCreator(
-                    gain_created=gc.get("gain_created", ""),
-                    feature_or_capability=gc.get(
-                        "feature_or_capability", ""
-                    ),
-                    how_created=gc.get("how_created", ""),
-                    creation_significance=gc.get("creation_significance", 5)
-                )
-            )
+        gain_creators = parse_list(GainCreator, [
+            {
+                "gain_created": gc.get("gain_created", ""),
+                "feature_or_capability": gc.get("feature_or_capability", ""),
+                "how_created": gc.get("how_created", ""),
+                "creation_significance": gc.get("creation_significance", 5)
+            }
+            for gc in data.get("gain_creators", [])
+        ])
         
         return ValuePropositionCanvas(
             icp_name=icp.icp_name,
@@ -372,7 +367,7 @@ class USPExtractionModule:
             value_proposition_statement=data.get(
                 "value_proposition_statement", ""
             ),
-            fit_score=data.get("fit_score", 0),
+            fit_score=data.get("fit_score") or 0,
             unique_differentiators=data.get("unique_differentiators", []),
             gaps_weaknesses=data.get("gaps_weaknesses", []),
             messaging_recommendations=data.get(
@@ -259,10 +259,10 @@ def add_icps_section(doc: Document, results: ResearchResults):
         if demo.company_size:
             demo_items.append(f"Company Size: {demo.company_size}")
         if demo.job_titles:
-            demo_items.append(f"Job Titles: {', '.join(demo.job_titles)}")
+            demo_items.append(f"Job Titles: {demo.job_titles_csv}")
         if demo.industry_verticals:
             demo_items.append(
-                f"Industries: {', '.join(demo.industry_verticals)}"
+                f"Industries: {demo.industry_verticals_csv}"
             )
         if demo.geographic_focus:
             demo_items.append(f"Geography: {demo.geographic_focus}")
@@ -281,9 +281,9 @@ def add_icps_section(doc: Document, results: ResearchResults):
             f"Risk Tolerance: {psycho.risk_tolerance.value}"
         ]
         if psycho.core_values:
-            psycho_items.append(f"Core Values: {', '.join(psycho.core_values)}")
+            psycho_items.append(f"Core Values: {psycho.core_values_csv}")
         if psycho.fears:
-            psycho_items.append(f"Key Fears: {', '.join(psycho.fears)}")
+            psycho_items.append(f"Key Fears: {psycho.fears_csv}")
         
         for item in psycho_items:
             doc.add_paragraph(item, style='List Bullet')
@@ -4,8 +4,12 @@ Markdown Report Generator
 Generates comprehensive Markdown reports from research results.
 """
 
-from datetime import datetime
-from typing import List
+import operator
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import List, Optional
 
 from app.models.research_models import (
     ResearchResults,
@@ -14,6 +18,34 @@ from app.models.research_models import (
 )
 
 
+# Reports with at least this many ICPs generate their sections in parallel
+PARALLEL_SECTIONS_MIN_ICPS = 4
+
+# Journey stages in display order, with getters for CustomerJourneyMap
+_STAGE_DEFS = tuple(
+    (name, operator.attrgetter(attr))
+    for name, attr in (
+        ("Awareness", "awareness_stage"),
+        ("Consideration", "consideration_stage"),
+        ("Decision", "decision_stage"),
+        ("Onboarding", "onboarding_stage"),
+        ("Expansion", "expansion_stage")
+    )
+)
+
+PAIN_TABLE_HEADER = (
+    "| Pain | Category | Severity |\n"
+    "|------|----------|----------|"
+)
+
+
+def _pain_table_rows(pains) -> str:
+    """Render pain points as Markdown table rows in a single join."""
+    return "\n".join(
+        f"| {p.statement} | {p.category} | {p.severity}/10 |" for p in pains
+    )
+
+
 def generate_markdown(results: ResearchResults) -> str:
     """
     Generate a comprehensive Markdown report from research results.
@@ -26,11 +58,18 @@ def generate_markdown(results: ResearchResults) -> str:
     """
     sections = []
     
+    # Which optional analyses are present, found in a single pass
+    has_vp = has_pain = has_journey = False
+    for icp_result in results.icps:
+        has_vp = has_vp or icp_result.value_proposition is not None
+        has_pain = has_pain or icp_result.pain_taxonomy is not None
+        has_journey = has_journey or icp_result.journey_map is not None
+    
     # Title
     sections.append(
         f"# Audience Research Report: {results.client_input.client_name}"
     )
-    sections.append(f"\n*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}*\n")
+    sections.append(f"\n*Generated: {time.strftime('%Y-%m-%d %H:%M')}*\n")
     
     # Table of Contents
     sections.append("## Table of Contents\n")
@@ -42,26 +81,27 @@ def generate_markdown(results: ResearchResults) -> str:
     sections.append("6. [Customer Journey Maps](#customer-journey-maps)")
     sections.append("7. [Cost Summary](#cost-summary)\n")
     
-    # Executive Summary
-    sections.append(generate_executive_summary(results))
-    
-    # Company Profile
-    sections.append(generate_company_section(results))
-    
-    # ICPs
-    sections.append(generate_icps_section(results))
-    
-    # Value Propositions
-    sections.append(generate_vp_section(results))
-    
-    # Pain Points
-    sections.append(generate_pain_section(results))
-    
-    # Journey Maps
-    sections.append(generate_journey_section(results))
+    # Body sections, in report order
+    section_generators = (
+        generate_executive_summary,
+        generate_company_section,
+        generate_icps_section,
+        partial(generate_vp_section, has_vp=has_vp),
+        partial(generate_pain_section, has_pain=has_pain),
+        partial(generate_journey_section, has_journey=has_journey),
+        generate_cost_section
+    )
     
-    # Cost Summary
-    sections.append(generate_cost_section(results))
+    # Sections are independent, so large reports render them concurrently
+    if len(results.icps) >= PARALLEL_SECTIONS_MIN_ICPS:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(generate, results)
+                for generate in section_generators
+            ]
+            sections.extend(f.result() for f in futures)
+    else:
+        sections.extend(generate(results) for generate in section_generators)
     
     return "\n".join(sections)
 
@@ -116,18 +156,28 @@ def generate_company_section(results: ResearchResults) -> str:
         lines.append("*Company profile not available.*\n")
         return "\n".join(lines)
     
-    lines.append(f"### {profile.name}\n")
-    lines.append(f"**Website:** {profile.website_url}\n")
-    lines.append(f"**Industry:** {profile.industry}\n")
-    lines.append(f"**Business Model:** {profile.business_model.value}\n")
+    # Read each profile field once
+    name = profile.name
+    website = profile.website_url
+    industry = profile.industry
+    business_model = profile.business_model.value
+    overview = profile.overview
+    products = profile.products_services
+    vps = profile.stated_value_propositions
+    comps = profile.competitors
     
-    if profile.overview:
-        lines.append(f"\n{profile.overview}\n")
+    lines.append(f"### {name}\n")
+    lines.append(f"**Website:** {website}\n")
+    lines.append(f"**Industry:** {industry}\n")
+    lines.append(f"**Business Model:** {business_model}\n")
+    
+    if overview:
+        lines.append(f"\n{overview}\n")
     
     # Products & Services
-    if profile.products_services:
+    if products:
         lines.append("### Products & Services\n")
-        for ps in profile.products_services:
+        for ps in products:
             lines.append(f"#### {ps.name}\n")
             lines.append(f"{ps.description}\n")
             if ps.features:
@@ -141,21 +191,21 @@ def generate_company_section(results: ResearchResults) -> str:
             lines.append("")
     
     # Value Propositions
-    if profile.stated_value_propositions:
+    if vps:
         lines.append("### Stated Value Propositions\n")
-        for vp in profile.stated_value_propositions:
+        for vp in vps:
             lines.append(f"- {vp}")
         lines.append("")
     
     # Competitors
-    if profile.competitors:
+    if comps:
         lines.append("### Competitive Landscape\n")
-        for comp in profile.competitors[:5]:
+        for comp in islice(comps, 5):
             lines.append(f"- **{comp.name}**")
             if comp.description:
                 lines.append(f"  - {comp.description}")
             if comp.key_differentiators:
-                diffs = ", ".join(comp.key_differentiators[:3])
+                diffs = ", ".join(islice(comp.key_differentiators, 3))
                 lines.append(f"  - Differentiators: {diffs}")
         lines.append("")
     
@@ -183,10 +233,10 @@ def generate_icps_section(results: ResearchResults) -> str:
         if demo.company_size:
             lines.append(f"- **Company Size:** {demo.company_size}")
         if demo.job_titles:
-            lines.append(f"- **Job Titles:** {', '.join(demo.job_titles)}")
+            lines.append(f"- **Job Titles:** {demo.job_titles_csv}")
         if demo.industry_verticals:
             lines.append(
-                f"- **Industries:** {', '.join(demo.industry_verticals)}"
+                f"- **Industries:** {demo.industry_verticals_csv}"
             )
         if demo.geographic_focus:
             lines.append(f"- **Geography:** {demo.geographic_focus}")
@@ -200,11 +250,11 @@ def generate_icps_section(results: ResearchResults) -> str:
         lines.append(f"- **Decision Style:** {psycho.decision_style.value}")
         lines.append(f"- **Risk Tolerance:** {psycho.risk_tolerance.value}")
         if psycho.core_values:
-            lines.append(f"- **Core Values:** {', '.join(psycho.core_values)}")
+            lines.append(f"- **Core Values:** {psycho.core_values_csv}")
         if psycho.aspirations:
-            lines.append(f"- **Aspirations:** {', '.join(psycho.aspirations)}")
+            lines.append(f"- **Aspirations:** {psycho.aspirations_csv}")
         if psycho.fears:
-            lines.append(f"- **Key Fears:** {', '.join(psycho.fears)}")
+            lines.append(f"- **Key Fears:** {psycho.fears_csv}")
         lines.append("")
         
         # Behavior
@@ -212,25 +262,25 @@ def generate_icps_section(results: ResearchResults) -> str:
         behav = icp.behavioral
         if behav.research_channels:
             lines.append(
-                f"- **Research Channels:** {', '.join(behav.research_channels)}"
+                f"- **Research Channels:** {behav.research_channels_csv}"
             )
         if behav.decision_timeline:
             lines.append(f"- **Decision Timeline:** {behav.decision_timeline}")
         if behav.content_preferences:
             lines.append(
                 f"- **Content Preferences:** "
-                f"{', '.join(behav.content_preferences)}"
+                f"{behav.content_preferences_csv}"
             )
         if behav.current_solutions:
             lines.append(
-                f"- **Current Solutions:** {', '.join(behav.current_solutions)}"
+                f"- **Current Solutions:** {behav.current_solutions_csv}"
             )
         lines.append("")
         
         # Motivations
         if icp.motivations:
             lines.append("#### Key Motivations\n")
-            for m in icp.motivations[:5]:
+            for m in islice(icp.motivations, 5):
                 lines.append(
                     f"- {m.statement} *(Intensity: {m.intensity}/10)*"
                 )
@@ -239,7 +289,7 @@ def generate_icps_section(results: ResearchResults) -> str:
         # Pain Points
         if icp.pain_points:
             lines.append("#### Key Pain Points\n")
-            for p in icp.pain_points[:5]:
+            for p in islice(icp.pain_points, 5):
                 lines.append(
                     f"- {p.statement} *(Severity: {p.severity}/10)*"
                 )
@@ -255,11 +305,19 @@ def generate_icps_section(results: ResearchResults) -> str:
     return "\n".join(lines)
 
 
-def generate_vp_section(results: ResearchResults) -> str:
-    """Generate value propositions section."""
+def generate_vp_section(
+    results: ResearchResults,
+    has_vp: Optional[bool] = None
+) -> str:
+    """
+    Generate value propositions section.
+    
+    ``has_vp`` may be precomputed by the caller to skip rescanning the ICPs.
+    """
     lines = ["## Value Propositions\n"]
     
-    has_vp = any(r.value_proposition for r in results.icps)
+    if has_vp is None:
+        has_vp = any(r.value_proposition is not None for r in results.icps)
     if not has_vp:
         lines.append("*Value propositions not analyzed.*\n")
         return "\n".join(lines)
@@ -282,7 +340,7 @@ def generate_vp_section(results: ResearchResults) -> str:
         # Pain Relievers
         if vp.pain_relievers:
             lines.append("#### Pain Relievers\n")
-            for pr in vp.pain_relievers[:5]:
+            for pr in islice(vp.pain_relievers, 5):
                 lines.append(f"**{pr.pain_addressed}**")
                 lines.append(f"- *Feature:* {pr.feature_or_capability}")
                 lines.append(f"- *How:* {pr.how_relieved}")
@@ -291,7 +349,7 @@ def generate_vp_section(results: ResearchResults) -> str:
         # Gain Creators
         if vp.gain_creators:
             lines.append("#### Gain Creators\n")
-            for gc in vp.gain_creators[:5]:
+            for gc in islice(vp.gain_creators, 5):
                 lines.append(f"**{gc.gain_created}**")
                 lines.append(f"- *Feature:* {gc.feature_or_capability}")
                 lines.append(f"- *How:* {gc.how_created}")
@@ -309,11 +367,19 @@ def generate_vp_section(results: ResearchResults) -> str:
     return "\n".join(lines)
 
 
-def generate_pain_section(results: ResearchResults) -> str:
-    """Generate pain points section."""
+def generate_pain_section(
+    results: ResearchResults,
+    has_pain: Optional[bool] = None
+) -> str:
+    """
+    Generate pain points section.
+    
+    ``has_pain`` may be precomputed by the caller to skip rescanning the ICPs.
+    """
     lines = ["## Pain Point Analysis\n"]
     
-    has_pain = any(r.pain_taxonomy for r in results.icps)
+    if has_pain is None:
+        has_pain = any(r.pain_taxonomy is not None for r in results.icps)
     if not has_pain:
         lines.append("*Pain taxonomy not analyzed.*\n")
         return "\n".join(lines)
@@ -330,28 +396,22 @@ def generate_pain_section(results: ResearchResults) -> str:
         # Functional Pains
         if pt.functional_pains:
             lines.append("#### Functional Pain Points\n")
-            lines.append("| Pain | Category | Severity |")
-            lines.append("|------|----------|----------|")
-            for p in pt.functional_pains[:7]:
-                lines.append(f"| {p.statement} | {p.category} | {p.severity}/10 |")
+            lines.append(PAIN_TABLE_HEADER)
+            lines.append(_pain_table_rows(islice(pt.functional_pains, 7)))
             lines.append("")
         
         # Financial Pains
         if pt.financial_pains:
             lines.append("#### Financial Pain Points\n")
-            lines.append("| Pain | Category | Severity |")
-            lines.append("|------|----------|----------|")
-            for p in pt.financial_pains[:7]:
-                lines.append(f"| {p.statement} | {p.category} | {p.severity}/10 |")
+            lines.append(PAIN_TABLE_HEADER)
+            lines.append(_pain_table_rows(islice(pt.financial_pains, 7)))
             lines.append("")
         
         # Emotional Pains
         if pt.emotional_pains:
             lines.append("#### Emotional Pain Points\n")
-            lines.append("| Pain | Category | Severity |")
-            lines.append("|------|----------|----------|")
-            for p in pt.emotional_pains[:7]:
-                lines.append(f"| {p.statement} | {p.category} | {p.severity}/10 |")
+            lines.append(PAIN_TABLE_HEADER)
+            lines.append(_pain_table_rows(islice(pt.emotional_pains, 7)))
             lines.append("")
         
         # Forces Analysis
@@ -361,22 +421,22 @@ def generate_pain_section(results: ResearchResults) -> str:
             
             if fa.push_factors:
                 lines.append("**Push Factors** (away from status quo):")
-                for f in fa.push_factors[:3]:
+                for f in islice(fa.push_factors, 3):
                     lines.append(f"- {f}")
             
             if fa.pull_factors:
                 lines.append("\n**Pull Factors** (toward new solution):")
-                for f in fa.pull_factors[:3]:
+                for f in islice(fa.pull_factors, 3):
                     lines.append(f"- {f}")
             
             if fa.habit_factors:
                 lines.append("\n**Habit Factors** (resistance to change):")
-                for f in fa.habit_factors[:3]:
+                for f in islice(fa.habit_factors, 3):
                     lines.append(f"- {f}")
             
             if fa.anxiety_factors:
                 lines.append("\n**Anxiety Factors** (fear of new):")
-                for f in fa.anxiety_factors[:3]:
+                for f in islice(fa.anxiety_factors, 3):
                     lines.append(f"- {f}")
             
             if fa.net_force_assessment:
@@ -392,11 +452,19 @@ def generate_pain_section(results: ResearchResults) -> str:
     return "\n".join(lines)
 
 
-def generate_journey_section(results: ResearchResults) -> str:
-    """Generate journey maps section."""
+def generate_journey_section(
+    results: ResearchResults,
+    has_journey: Optional[bool] = None
+) -> str:
+    """
+    Generate journey maps section.
+    
+    ``has_journey`` may be precomputed by the caller to skip rescanning the ICPs.
+    """
     lines = ["## Customer Journey Maps\n"]
     
-    has_journey = any(r.journey_map for r in results.icps)
+    if has_journey is None:
+        has_journey = any(r.journey_map is not None for r in results.icps)
     if not has_journey:
         lines.append("*Journey maps not generated.*\n")
         return "\n".join(lines)
@@ -413,15 +481,8 @@ def generate_journey_section(results: ResearchResults) -> str:
         if jm.overall_timeline:
             lines.append(f"**Overall Timeline:** {jm.overall_timeline}\n")
         
-        stages = [
-            ("Awareness", jm.awareness_stage),
-            ("Consideration", jm.consideration_stage),
-            ("Decision", jm.decision_stage),
-            ("Onboarding", jm.onboarding_stage),
-            ("Expansion", jm.expansion_stage)
-        ]
-        
-        for stage_name, stage in stages:
+        for stage_name, get_stage in _STAGE_DEFS:
+            stage = get_stage(jm)
             if not stage:
                 continue
             
@@ -430,22 +491,22 @@ def generate_journey_section(results: ResearchResults) -> str:
             
             if stage.emotional_state:
                 lines.append(
-                    f"**Emotional State:** {', '.join(stage.emotional_state)}"
+                    f"**Emotional State:** {stage.emotional_state_csv}"
                 )
             
             if stage.key_questions:
                 lines.append("\n**Key Questions:**")
-                for q in stage.key_questions[:5]:
+                for q in islice(stage.key_questions, 5):
                     lines.append(f"- {q}")
             
             if stage.content_themes:
                 lines.append("\n**Content Themes:**")
-                for t in stage.content_themes[:5]:
+                for t in islice(stage.content_themes, 5):
                     lines.append(f"- {t}")
             
             if stage.content_ideas:
                 lines.append("\n**Content Ideas:**")
-                for idea in stage.content_ideas[:5]:
+                for idea in islice(stage.content_ideas, 5):
                     lines.append(f"\n**{idea.title}** ({idea.format})")
                     if idea.hook:
                         lines.append(f"- *Hook:* {idea.hook}")
@@ -456,11 +517,11 @@ def generate_journey_section(results: ResearchResults) -> str:
             
             if stage.preferred_channels:
                 lines.append(
-                    f"\n**Channels:** {', '.join(stage.preferred_channels)}"
+                    f"\n**Channels:** {stage.preferred_channels_csv}"
                 )
             
             if stage.kpis:
-                lines.append(f"\n**KPIs:** {', '.join(stage.kpis)}")
+                lines.append(f"\n**KPIs:** {stage.kpis_csv}")
             
             lines.append("")
         
@@ -489,14 +550,15 @@ def generate_cost_section(results: ResearchResults) -> str:
     by_model = summary.get('by_model', {})
     if by_model:
         lines.append("### Usage by Model\n")
-        lines.append("| Model | Requests | Tokens | Cost |")
-        lines.append("|-------|----------|--------|------|")
-        for model, data in by_model.items():
-            short_name = model.split('/')[-1]
-            lines.append(
-                f"| {short_name} | {data['requests']} | "
-                f"{data['total_tokens']:,} | ${data['cost']:.4f} |"
-            )
+        lines.append(
+            "| Model | Requests | Tokens | Cost |\n"
+            "|-------|----------|--------|------|"
+        )
+        lines.append("\n".join(
+            f"| {model.split('/')[-1]} | {data['requests']} | "
+            f"{data['total_tokens']:,} | ${data['cost']:.4f} |"
+            for model, data in by_model.items()
+        ))
         lines.append("")
     
     return "\n".join(lines)
\ No newline at end of file
@@ -2,17 +2,31 @@
 OpenRouter API Client
 =====================
 Handles all communication with the OpenRouter API for LLM interactions.
+
+Everything goes through OpenRouter's chat completions endpoint. OpenRouter
+has no offline batch endpoint (like OpenAI's /v1/batches or Anthropic's
+Message Batches) to route to at a discount; the batching available here is
+fusing several prompts into one request (analyze_batch).
 """
 
+import functools
+import gzip
+import hashlib
+import io
+import itertools
+import logging
+import threading
+from collections import defaultdict
 import httpx
-from typing import Optional, Dict, Any, List
+import orjson
+from diskcache import Cache
+from typing import Callable, Optional, Dict, Any, List
 from dataclasses import dataclass, field
-from datetime import datetime
 from tenacity import (
     retry,
     stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type
+    wait_random_exponential,
+    retry_if_exception
 )
 import streamlit as st
 
@@ -25,7 +39,110 @@ from app.config import (
 )
 
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+# ===== Shared HTTP Connection Pool =====
+
+# A single process-wide client keeps TCP/TLS connections to OpenRouter warm
+# across OpenRouterClient instances (e.g. Streamlit reruns). Auth headers are
+# sent per request so clients with different API keys can share the pool.
+_CLIENT_SINGLETON: Optional[httpx.Client] = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """Get (lazily creating) the shared HTTP/2 client for OpenRouter."""
+    global _CLIENT_SINGLETON
+    with _CLIENT_LOCK:
+        if _CLIENT_SINGLETON is None or _CLIENT_SINGLETON.is_closed:
+            _CLIENT_SINGLETON = httpx.Client(
+                base_url=APP_CONFIG["openrouter_base_url"],
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=APP_CONFIG[
+                        "max_keepalive_connections"
+                    ],
+                    max_connections=APP_CONFIG["max_connections"]
+                ),
+                timeout=APP_CONFIG["request_timeout"]
+            )
+        return _CLIENT_SINGLETON
+
+
+@functools.lru_cache(maxsize=4)
+def _headers_for(api_key: str) -> Dict[str, str]:
+    """Get (cached) request headers for an API key. Do not mutate."""
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "HTTP-Referer": "https://cognitive-resonance-engine.streamlit.app",
+        "X-Title": "Cognitive Resonance Engine"
+    }
+
+
+# ===== Response Cache =====
+
+# Low-temperature calls are effectively deterministic, so identical requests
+# (e.g. re-running the same client research) are served from a local disk
+# cache instead of paying for the API call again.
+_RESPONSE_CACHE: Optional[Cache] = None
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+def _get_response_cache() -> Cache:
+    """Get (lazily opening) the on-disk LLM response cache."""
+    global _RESPONSE_CACHE
+    with _RESPONSE_CACHE_LOCK:
+        if _RESPONSE_CACHE is None:
+            _RESPONSE_CACHE = Cache(APP_CONFIG["llm_cache_dir"])
+        return _RESPONSE_CACHE
+
+
+def _response_cache_key(
+    model: str,
+    temperature: float,
+    messages: List[Dict[str, str]],
+    max_tokens: Optional[int]
+) -> Optional[str]:
+    """Content-addressed cache key, or None if the call is not cacheable."""
+    if temperature > APP_CONFIG["llm_cache_max_temperature"]:
+        return None
+    return hashlib.blake2b(
+        orjson.dumps((model, temperature, messages, max_tokens)),
+        digest_size=16
+    ).hexdigest()
+
+
+# ===== Retry Policy =====
+
+# Transient failures worth retrying; other 4xx (bad request, auth, no
+# credits) fail fast instead of burning back-off time.
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+def _retryable(exc: BaseException) -> bool:
+    """Return True if a request failure is transient and worth retrying."""
+    if isinstance(exc, (httpx.TimeoutException, httpx.ConnectError)):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS_CODES
+    return False
+
+
+# Jittered back-off keeps concurrent workers from retrying in lockstep
+_RETRY_POLICY = retry(
+    stop=stop_after_attempt(APP_CONFIG["max_retries"]),
+    wait=wait_random_exponential(multiplier=1, max=10),
+    retry=retry_if_exception(_retryable)
+)
+
+
+# Monotonic sequence for ordering usage records (cheaper than a timestamp)
+_USAGE_SEQ = itertools.count(1)
+
+
+@dataclass(slots=True)
 class TokenUsage:
     """Track token usage for a single request."""
     model: str
@@ -33,16 +150,88 @@ class TokenUsage:
     output_tokens: int
     total_tokens: int
     estimated_cost: float
-    timestamp: datetime = field(default_factory=datetime.now)
+    seq: int = field(default_factory=_USAGE_SEQ.__next__)
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """Response from an LLM request."""
     content: str
     model: str
     usage: TokenUsage
-    raw_response: Dict[str, Any]
+    # gzip-compressed JSON body; only kept when the client has keep_raw=True
+    raw_response: Optional[bytes] = None
+    
+    def get_raw_response(self) -> Optional[Dict[str, Any]]:
+        """Decompress and parse the stored raw response, if kept."""
+        if self.raw_response is None:
+            return None
+        return orjson.loads(gzip.decompress(self.raw_response))
+
+
+class _StreamAccumulator:
+    """
+    Accumulates an OpenRouter server-sent-events completion stream.
+    
+    Feed it raw SSE lines; it collects content deltas and usage, and
+    produces a response dict shaped like a non-streamed completion.
+    """
+    
+    def __init__(self, model: str):
+        self.model = model
+        self.content = io.StringIO()
+        self.usage: Dict[str, Any] = {}
+        self.response_id: Optional[str] = None
+        self.finish_reason: Optional[str] = None
+        self.done = False
+    
+    def feed(self, line: str) -> Optional[str]:
+        """Consume one SSE line and return its content delta, if any."""
+        # Skip blank keep-alives and SSE comments (": OPENROUTER PROCESSING")
+        if not line.startswith("data:"):
+            return None
+        
+        data = line[5:].strip()
+        if data == "[DONE]":
+            self.done = True
+            return None
+        
+        chunk = orjson.loads(data)
+        if "error" in chunk:
+            error_msg = chunk["error"].get("message", str(chunk["error"]))
+            logger.warning("OpenRouter stream returned error: %s", error_msg)
+            raise ValueError(f"OpenRouter API error: {error_msg}")
+        
+        self.response_id = chunk.get("id", self.response_id)
+        if chunk.get("usage"):
+            self.usage = chunk["usage"]
+        
+        choices = chunk.get("choices") or []
+        if not choices:
+            return None
+        
+        self.finish_reason = choices[0].get("finish_reason") or self.finish_reason
+        delta = (choices[0].get("delta") or {}).get("content")
+        if delta:
+            self.content.write(delta)
+        return delta
+    
+    def result(self) -> Dict[str, Any]:
+        """Build the aggregated, non-streamed-shaped response dict."""
+        content = self.content.getvalue()
+        logger.debug("OpenRouter streamed content length: %d", len(content))
+        if not content:
+            raise ValueError("OpenRouter API returned empty content")
+        
+        return {
+            "id": self.response_id,
+            "model": self.model,
+            "choices": [{
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": self.finish_reason
+            }],
+            "usage": self.usage
+        }
 
 
 class CostTracker:
@@ -50,44 +239,83 @@ class CostTracker:
     
     def __init__(self):
         self.usage_log: List[TokenUsage] = []
+        
+        # Running aggregates, updated on every log_usage call
+        self._total_cost = 0.0
+        self._totals = {"input": 0, "output": 0, "total": 0}
+        self._by_model: Dict[str, Dict[str, Any]] = defaultdict(
+            self._empty_model_usage
+        )
+        
+        # Pipeline stages may log usage from several worker threads
+        self._lock = threading.Lock()
+        
+        # Cached get_summary() result, cleared whenever usage is logged
+        self._summary: Optional[Dict[str, Any]] = None
     
     def log_usage(self, usage: TokenUsage):
         """Log a token usage record."""
-        self.usage_log.append(usage)
+        with self._lock:
+            self.usage_log.append(usage)
+            
+            self._total_cost += usage.estimated_cost
+            self._totals["input"] += usage.input_tokens
+            self._totals["output"] += usage.output_tokens
+            self._totals["total"] += usage.total_tokens
+            
+            model_usage = self._by_model[usage.model]
+            model_usage["input_tokens"] += usage.input_tokens
+            model_usage["output_tokens"] += usage.output_tokens
+            model_usage["total_tokens"] += usage.total_tokens
+            model_usage["cost"] += usage.estimated_cost
+            model_usage["requests"] += 1
+            
+            self._summary = None
+    
+    @staticmethod
+    def _empty_model_usage() -> Dict[str, Any]:
+        return {
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "total_tokens": 0,
+            "cost": 0.0,
+            "requests": 0
+        }
     
     def get_total_cost(self) -> float:
         """Get total cost for the session."""
-        return sum(u.estimated_cost for u in self.usage_log)
+        return self._total_cost
     
     def get_total_tokens(self) -> Dict[str, int]:
         """Get total input and output tokens."""
-        return {
-            "input": sum(u.input_tokens for u in self.usage_log),
-            "output": sum(u.output_tokens for u in self.usage_log),
-            "total": sum(u.total_tokens for u in self.usage_log)
-        }
+        return dict(self._totals)
     
     def get_usage_by_model(self) -> Dict[str, Dict[str, Any]]:
         """Get usage breakdown by model."""
-        breakdown = {}
-        for usage in self.usage_log:
-            if usage.model not in breakdown:
-                breakdown[usage.model] = {
-                    "input_tokens": 0,
-                    "output_tokens": 0,
-                    "total_tokens": 0,
-                    "cost": 0.0,
-                    "requests": 0
-                }
-            breakdown[usage.model]["input_tokens"] += usage.input_tokens
-            breakdown[usage.model]["output_tokens"] += usage.output_tokens
-            breakdown[usage.model]["total_tokens"] += usage.total_tokens
-            breakdown[usage.model]["cost"] += usage.estimated_cost
-            breakdown[usage.model]["requests"] += 1
-        return breakdown
+        return {
+            model: dict(model_usage)
+            for model, model_usage in self._by_model.items()
+        }
+    
+    @property
+    def summary(self) -> Dict[str, Any]:
+        """
+        Complete usage summary, rebuilt only after new usage is logged.
+        
+        The same dict is returned until then; treat it as read-only.
+        """
+        with self._lock:
+            if self._summary is None:
+                self._summary = self._build_summary()
+            return self._summary
     
     def get_summary(self) -> Dict[str, Any]:
         """Get a complete usage summary."""
+        with self._lock:
+            return self._build_summary()
+    
+    def _build_summary(self) -> Dict[str, Any]:
+        """Snapshot the running aggregates; caller holds the lock."""
         return {
             "total_cost": self.get_total_cost(),
             "total_tokens": self.get_total_tokens(),
@@ -102,7 +330,9 @@ class OpenRouterClient:
     def __init__(
         self,
         api_key: Optional[str] = None,
-        cost_tracker: Optional[CostTracker] = None
+        cost_tracker: Optional[CostTracker] = None,
+        keep_raw: bool = False,
+        use_cache: bool = True
     ):
         """
         Initialize the OpenRouter client.
@@ -111,18 +341,21 @@ class OpenRouterClient:
             api_key: OpenRouter API key. If not provided, will try to get
                      from Streamlit secrets.
             cost_tracker: Optional cost tracker for logging usage.
+            keep_raw: Keep a compressed copy of each raw API response on
+                      the returned LLMResponse (off by default to save RAM).
+            use_cache: Serve and store deterministic (low-temperature)
+                       responses through the on-disk response cache.
         """
         self.api_key = api_key or self._get_api_key()
         self.base_url = APP_CONFIG["openrouter_base_url"]
         self.timeout = APP_CONFIG["request_timeout"]
         self.cost_tracker = cost_tracker or CostTracker()
+        self.keep_raw = keep_raw
+        self.use_cache = use_cache
         
-        # HTTP client
-        self.client = httpx.Client(
-            base_url=self.base_url,
-            timeout=self.timeout,
-            headers=self._get_headers()
-        )
+        # Shared HTTP client (not owned by this instance)
+        self.client = _get_http_client()
+        self.headers = _headers_for(self.api_key)
     
     def _get_api_key(self) -> str:
         """Get API key from Streamlit secrets."""
@@ -140,39 +373,15 @@ class OpenRouterClient:
                 "OPENROUTER_API_KEY in your Streamlit secrets."
             )
     
-    def _get_headers(self) -> Dict[str, str]:
-        """Get headers for API requests."""
-        return {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://cognitive-resonance-engine.streamlit.app",
-            "X-Title": "Cognitive Resonance Engine"
-        }
-    
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((httpx.TimeoutException, httpx.HTTPStatusError))
-    )
-    def _make_request(
+    def _build_payload(
         self,
         model: str,
         messages: List[Dict[str, str]],
-        temperature: float = 0.7,
-        max_tokens: Optional[int] = None
+        temperature: float,
+        max_tokens: Optional[int],
+        response_format: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """
-        Make a request to the OpenRouter API.
-        
-        Args:
-            model: Model ID to use
-            messages: List of message dicts with 'role' and 'content'
-            temperature: Sampling temperature (0-1)
-            max_tokens: Maximum tokens in response
-            
-        Returns:
-            Raw API response dict
-        """
+        """Build the chat completions request payload."""
         model_config = get_model_config(model)
         
         payload = {
@@ -186,13 +395,24 @@ class OpenRouterClient:
         else:
             payload["max_tokens"] = model_config.max_tokens
         
+        if response_format:
+            payload["response_format"] = response_format
+        
         # DEBUG: Print request info (visible in Streamlit Cloud logs)
         print(f"[OpenRouter] Making request to model: {model}")
         print(f"[OpenRouter] Payload keys: {list(payload.keys())}")
         print(f"[OpenRouter] Message count: {len(messages)}")
         
-        response = self.client.post("/chat/completions", json=payload)
+        return payload
+    
+    def _parse_response(self, response: httpx.Response) -> Dict[str, Any]:
+        """
+        Validate an API response and return its parsed JSON body.
         
+        Raises:
+            httpx.HTTPStatusError: For non-2xx responses
+            ValueError: For empty, non-JSON, or error/empty-content bodies
+        """
         # DEBUG: Print response status
         print(f"[OpenRouter] Response status: {response.status_code}")
         
@@ -222,7 +442,7 @@ class OpenRouterClient:
             raise ValueError("Received HTML error page instead of JSON from OpenRouter API")
 
         try:
-            result = response.json()
+            result = orjson.loads(response.content)
         except Exception as json_err:
             print(f"[OpenRouter] ERROR: Failed to parse response as JSON: {json_err}")
             print(f"[OpenRouter] Response preview: {response_text[:500]}")
@@ -252,46 +472,38 @@ class OpenRouterClient:
 
         return result
     
-    def chat(
+    def _build_llm_response(
         self,
-        messages: List[Dict[str, str]],
-        model: Optional[str] = None,
-        temperature: float = 0.7,
-        max_tokens: Optional[int] = None,
-        system_prompt: Optional[str] = None
+        model: str,
+        raw_response: Dict[str, Any],
+        cached: bool = False
     ) -> LLMResponse:
         """
-        Send a chat completion request.
+        Extract content and usage from a raw response and log its cost.
         
-        Args:
-            messages: List of message dicts with 'role' and 'content'
-            model: Model ID (defaults to DEFAULT_ANALYSIS_MODEL)
-            temperature: Sampling temperature
-            max_tokens: Maximum tokens in response
-            system_prompt: Optional system prompt to prepend
-            
-        Returns:
-            LLMResponse with content and usage info
+        Cached responses cost nothing, so they get an empty usage record
+        that is not logged to the cost tracker.
         """
-        model = model or DEFAULT_ANALYSIS_MODEL
-        
-        # Prepend system prompt if provided
-        if system_prompt:
-            messages = [
-                {"role": "system", "content": system_prompt}
-            ] + messages
-        
-        # Make request
-        raw_response = self._make_request(
-            model=model,
-            messages=messages,
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
-        
         # Extract content
         content = raw_response["choices"][0]["message"]["content"]
         
+        if cached:
+            return LLMResponse(
+                content=content,
+                model=model,
+                usage=TokenUsage(
+                    model=model,
+                    input_tokens=0,
+                    output_tokens=0,
+                    total_tokens=0,
+                    estimated_cost=0.0
+                ),
+                raw_response=(
+                    gzip.compress(orjson.dumps(raw_response))
+                    if self.keep_raw else None
+                )
+            )
+        
         # Extract usage
         usage_data = raw_response.get("usage", {})
         input_tokens = usage_data.get("prompt_tokens", 0)
@@ -317,9 +529,249 @@ class OpenRouterClient:
             content=content,
             model=model,
             usage=usage,
-            raw_response=raw_response
+            raw_response=(
+                gzip.compress(orjson.dumps(raw_response))
+                if self.keep_raw else None
+            )
         )
     
+    @staticmethod
+    def _chat_messages(
+        messages: List[Dict[str, str]],
+        system_prompt: Optional[str]
+    ) -> List[Dict[str, str]]:
+        """Prepend the system prompt to the messages if provided."""
+        if system_prompt:
+            return [{"role": "system", "content": system_prompt}] + messages
+        return messages
+    
+    @staticmethod
+    def _research_messages(
+        query: str,
+        context: Optional[str]
+    ) -> List[Dict[str, str]]:
+        """Build the message list for a research query."""
+        messages = []
+        if context:
+            messages.append({
+                "role": "system",
+                "content": f"Context: {context}"
+            })
+        
+        messages.append({
+            "role": "user",
+            "content": query
+        })
+        return messages
+    
+    @staticmethod
+    def _analysis_messages(
+        prompt: str,
+        data: Optional[str]
+    ) -> List[Dict[str, str]]:
+        """Build the message list for an analysis prompt."""
+        content = prompt
+        if data:
+            content = f"{prompt}\n\nDATA:\n{data}"
+        
+        return [{"role": "user", "content": content}]
+    
+    @staticmethod
+    def _batch_messages(
+        prompts: List[str],
+        data: Optional[List[Optional[str]]],
+        prefix: Optional[str] = None
+    ) -> List[Dict[str, str]]:
+        """Fuse several independent prompts into one user message."""
+        parts = [prefix] if prefix else []
+        parts.append(
+            f"Process each of the following {len(prompts)} items "
+            f"independently. Return a JSON object of the form "
+            f'{{"results": [...]}} where "results" is an array of exactly '
+            f"{len(prompts)} objects, one per item, in the same order."
+        )
+        for i, prompt in enumerate(prompts):
+            item = prompt
+            if data and data[i]:
+                item = f"{prompt}\n\nDATA:\n{data[i]}"
+            parts.append(f"## Item {i + 1}\n\n{item}")
+        
+        return [{"role": "user", "content": "\n\n".join(parts)}]
+    
+    @staticmethod
+    def _batch_response_format(
+        response_schema: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Wrap a per-item JSON schema into a batch response_format."""
+        if not response_schema:
+            return None
+        return {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "batch_results",
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "results": {"type": "array", "items": response_schema}
+                    },
+                    "required": ["results"]
+                }
+            }
+        }
+    
+    def _split_batch_response(
+        self,
+        model: str,
+        raw_response: Dict[str, Any],
+        num_items: int
+    ) -> List[LLMResponse]:
+        """Split a fused batch response into one LLMResponse per item."""
+        response = self._build_llm_response(model, raw_response)
+        
+        content = response.content.strip()
+        if content.startswith("```"):
+            content = content.split("\n", 1)[-1].rsplit("```", 1)[0]
+        
+        try:
+            parsed = orjson.loads(content)
+        except orjson.JSONDecodeError as e:
+            raise ValueError(f"Batch response is not valid JSON: {e}")
+        
+        items = parsed.get("results") if isinstance(parsed, dict) else parsed
+        if not isinstance(items, list) or len(items) != num_items:
+            raise ValueError(
+                f"Batch response did not contain {num_items} results"
+            )
+        
+        # All items share the single request's usage record
+        return [
+            LLMResponse(
+                content=orjson.dumps(item).decode("utf-8"),
+                model=model,
+                usage=response.usage,
+                raw_response=response.raw_response
+            )
+            for item in items
+        ]
+    
+    @_RETRY_POLICY
+    def _make_request(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        stream: bool = False,
+        on_chunk: Optional[Callable[[str], None]] = None,
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Make a request to the OpenRouter API.
+        
+        Args:
+            model: Model ID to use
+            messages: List of message dicts with 'role' and 'content'
+            temperature: Sampling temperature (0-1)
+            max_tokens: Maximum tokens in response
+            stream: Stream the completion via SSE and aggregate it
+            on_chunk: Optional callback receiving each streamed content delta
+            response_format: Optional OpenAI-style response_format spec
+            
+        Returns:
+            Raw API response dict (synthesized from chunks when streaming)
+        """
+        payload = self._build_payload(
+            model, messages, temperature, max_tokens, response_format
+        )
+        
+        if stream:
+            with self.client.stream(
+                "POST",
+                "/chat/completions",
+                content=orjson.dumps({**payload, "stream": True}),
+                headers=self.headers
+            ) as response:
+                if response.status_code != 200:
+                    response.read()
+                    self._parse_response(response)
+                
+                accumulator = _StreamAccumulator(model)
+                for line in response.iter_lines():
+                    delta = accumulator.feed(line)
+                    if delta and on_chunk:
+                        on_chunk(delta)
+                    if accumulator.done:
+                        break
+            
+            return accumulator.result()
+        
+        response = self.client.post(
+            "/chat/completions",
+            content=orjson.dumps(payload),
+            headers=self.headers
+        )
+        
+        return self._parse_response(response)
+    
+    def chat(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        system_prompt: Optional[str] = None,
+        stream: bool = False,
+        on_chunk: Optional[Callable[[str], None]] = None
+    ) -> LLMResponse:
+        """
+        Send a chat completion request.
+        
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            model: Model ID (defaults to DEFAULT_ANALYSIS_MODEL)
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
+            system_prompt: Optional system prompt to prepend
+            stream: Stream the completion instead of waiting for the full body
+            on_chunk: Optional callback receiving each streamed content delta
+            
+        Returns:
+            LLMResponse with content and usage info
+        """
+        model = model or DEFAULT_ANALYSIS_MODEL
+        messages = self._chat_messages(messages, system_prompt)
+        
+        # Serve deterministic (low-temperature) requests from the cache
+        cache_key = (
+            _response_cache_key(model, temperature, messages, max_tokens)
+            if self.use_cache else None
+        )
+        if cache_key:
+            cached = _get_response_cache().get(cache_key)
+            if cached is not None:
+                response = self._build_llm_response(model, cached, cached=True)
+                if on_chunk:
+                    on_chunk(response.content)
+                return response
+        
+        raw_response = self._make_request(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=stream,
+            on_chunk=on_chunk
+        )
+        
+        if cache_key:
+            _get_response_cache().set(
+                cache_key,
+                raw_response,
+                expire=APP_CONFIG["llm_cache_ttl"]
+            )
+        
+        return self._build_llm_response(model, raw_response)
+    
     def research(
         self,
         query: str,
@@ -337,23 +789,9 @@ class OpenRouterClient:
         Returns:
             LLMResponse with research results
         """
-        model = model or DEFAULT_RESEARCH_MODEL
-        
-        messages = []
-        if context:
-            messages.append({
-                "role": "system",
-                "content": f"Context: {context}"
-            })
-        
-        messages.append({
-            "role": "user",
-            "content": query
-        })
-        
         return self.chat(
-            messages=messages,
-            model=model,
+            messages=self._research_messages(query, context),
+            model=model or DEFAULT_RESEARCH_MODEL,
             temperature=0.3  # Lower temperature for research
         )
     
@@ -362,7 +800,10 @@ class OpenRouterClient:
         prompt: str,
         data: Optional[str] = None,
         model: Optional[str] = None,
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[str] = None,
+        stream: bool = False,
+        on_chunk: Optional[Callable[[str], None]] = None,
+        max_tokens: Optional[int] = None
     ) -> LLMResponse:
         """
         Run an analysis prompt.
@@ -372,28 +813,78 @@ class OpenRouterClient:
             data: Optional data to include in the request
             model: Model to use (defaults to analysis model)
             system_prompt: Optional system prompt
+            stream: Stream the completion instead of waiting for the full body
+            on_chunk: Optional callback receiving each streamed content delta
+            max_tokens: Maximum tokens in response (defaults to the model's)
             
         Returns:
             LLMResponse with analysis results
         """
-        model = model or DEFAULT_ANALYSIS_MODEL
+        return self.chat(
+            messages=self._analysis_messages(prompt, data),
+            model=model or DEFAULT_ANALYSIS_MODEL,
+            temperature=0.7,
+            max_tokens=max_tokens,
+            system_prompt=system_prompt,
+            stream=stream,
+            on_chunk=on_chunk
+        )
+    
+    def analyze_batch(
+        self,
+        prompts: List[str],
+        data: Optional[List[Optional[str]]] = None,
+        response_schema: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+        prefix: Optional[str] = None,
+        max_tokens: Optional[int] = None
+    ) -> List[LLMResponse]:
+        """
+        Run several independent analysis prompts in a single request.
         
-        content = prompt
-        if data:
-            content = f"{prompt}\n\nDATA:\n{data}"
+        The prompts share one system prompt, an optional shared prefix
+        (context and instructions common to every item) and one round-trip;
+        the model is asked for a JSON array with one result per prompt,
+        which is split back into one LLMResponse per prompt (content is
+        each item's JSON).
         
-        messages = [{"role": "user", "content": content}]
+        Args:
+            prompts: The analysis prompts
+            data: Optional per-prompt data, aligned with prompts
+            response_schema: Optional JSON schema for a single item
+            model: Model to use (defaults to analysis model)
+            system_prompt: Optional system prompt
+            prefix: Optional text sent once ahead of the numbered items
+            max_tokens: Maximum tokens in response (defaults to the model's)
+            
+        Returns:
+            One LLMResponse per prompt, in order
+            
+        Raises:
+            ValueError: If the response cannot be split into len(prompts) items
+        """
+        model = model or DEFAULT_ANALYSIS_MODEL
         
-        return self.chat(
-            messages=messages,
+        raw_response = self._make_request(
             model=model,
+            messages=self._chat_messages(
+                self._batch_messages(prompts, data, prefix), system_prompt
+            ),
             temperature=0.7,
-            system_prompt=system_prompt
+            max_tokens=max_tokens,
+            response_format=self._batch_response_format(response_schema)
         )
+        
+        return self._split_batch_response(model, raw_response, len(prompts))
     
     def close(self):
-        """Close the HTTP client."""
-        self.client.close()
+        """
+        Release the client.
+        
+        The underlying HTTP connection pool is shared process-wide and is
+        kept open for reuse, so this is a no-op.
+        """
     
     def __enter__(self):
         return self
@@ -404,7 +895,8 @@ class OpenRouterClient:
 
 def create_client(
     api_key: Optional[str] = None,
-    cost_tracker: Optional[CostTracker] = None
+    cost_tracker: Optional[CostTracker] = None,
+    keep_raw: bool = False
 ) -> OpenRouterClient:
     """
     Factory function to create an OpenRouter client.
@@ -412,8 +904,14 @@ def create_client(
     Args:
         api_key: Optional API key
         cost_tracker: Optional cost tracker
+        keep_raw: Keep compressed raw responses on LLMResponse
         
     Returns:
         Configured OpenRouterClient
     """
-    return OpenRouterClient(api_key=api_key, cost_tracker=cost_tracker)
\ No newline at end of file
+    return OpenRouterClient(
+        api_key=api_key,
+        cost_tracker=cost_tracker,
+        keep_raw=keep_raw
+    )
+
@@ -4,8 +4,14 @@ Cognitive Resonance Engine - Main Application
 Streamlit-based audience research platform.
 """
 
+import functools
+import queue
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from app.config import (
     APP_CONFIG,
@@ -22,8 +28,11 @@ from app.models.research_models import (
     ResearchResults,
     SessionState
 )
-from app.llm.openrouter_client import OpenRouterClient, CostTracker
-from app.core.orchestrator import ResearchOrchestrator
+from app.export import generate_markdown, generate_docx
+from app.ui import checkout_orchestrator
+
+if TYPE_CHECKING:
+    from app.llm.openrouter_client import CostTracker
 
 
 # ===== Page Configuration =====
@@ -36,27 +45,65 @@ st.set_page_config(
 )
 
 
+# Static model choices for the sidebar selectbox
+_MODEL_OPTIONS = tuple(ANALYSIS_MODELS.keys())
+_DEFAULT_IDX = (
+    _MODEL_OPTIONS.index(DEFAULT_ANALYSIS_MODEL)
+    if DEFAULT_ANALYSIS_MODEL in _MODEL_OPTIONS else 0
+)
+
+# Loose sanity check for user-entered URLs (scheme + non-empty host)
+_URL_RE = re.compile(r"^https?://[^\s/$.?#].[^\s]*$", re.IGNORECASE)
+
+
+# ===== Lazy Imports =====
+# The LLM client and pipeline modules are only needed once research starts,
+# so keep them off the landing page's import path.
+
+@functools.lru_cache(maxsize=1)
+def _load_cost_tracker():
+    """Import and return the CostTracker class."""
+    from app.llm.openrouter_client import CostTracker
+    return CostTracker
+
+
 # ===== Session State Initialization =====
 
+def _default_settings() -> dict:
+    """Initial sidebar settings (model, ICP count, pain batch size)."""
+    return {
+        "model": _MODEL_OPTIONS[_DEFAULT_IDX],
+        "num_icps": APP_CONFIG["default_num_icps"],
+        "batch_size": APP_CONFIG["default_batch_size"]
+    }
+
+
+# Defaults that need constructing; only built when the key is missing
+_SESSION_FACTORIES = (
+    ("session", SessionState),
+    ("cost_tracker", lambda: _load_cost_tracker()()),
+    ("stage_outputs", dict),
+    ("settings", _default_settings),
+)
+
+
 def init_session_state():
     """Initialize session state variables."""
-    if "session" not in st.session_state:
-        st.session_state.session = SessionState()
-    if "cost_tracker" not in st.session_state:
-        st.session_state.cost_tracker = CostTracker()
-    if "results" not in st.session_state:
-        st.session_state.results = None
-    if "is_running" not in st.session_state:
-        st.session_state.is_running = False
-    if "current_stage" not in st.session_state:
-        st.session_state.current_stage = None
-    if "stage_outputs" not in st.session_state:
-        st.session_state.stage_outputs = {}
+    state = st.session_state
+    state.setdefault("results", None)
+    state.setdefault("is_running", False)
+    state.setdefault("current_stage", None)
+    state.setdefault("future", None)
+    state.setdefault("progress_queue", None)
+    
+    for key, factory in _SESSION_FACTORIES:
+        if key not in state:
+            state[key] = factory()
 
 
 # ===== Sidebar =====
 
-def render_sidebar():
+def render_sidebar(summary: dict):
     """Render the sidebar with model selection and settings."""
     with st.sidebar:
         st.image(
@@ -67,26 +114,50 @@ def render_sidebar():
         
         st.markdown("---")
         
-        # Model Selection
-        st.subheader("🤖 Analysis Model")
-        
-        model_options = list(ANALYSIS_MODELS.keys())
-        model_names = [ANALYSIS_MODELS[m].name for m in model_options]
-        
-        selected_idx = model_options.index(DEFAULT_ANALYSIS_MODEL) \
-            if DEFAULT_ANALYSIS_MODEL in model_options else 0
+        # Settings only take effect (and rerun the app) on "Apply"
+        settings = st.session_state.settings
         
-        selected_model = st.selectbox(
-            "Select model for analysis:",
-            options=model_options,
-            format_func=lambda x: ANALYSIS_MODELS[x].name,
-            index=selected_idx,
-            help="Perplexity Sonar is always used for research. "
-                 "This model is used for analysis."
-        )
+        with st.form("settings"):
+            # Model Selection
+            st.subheader("🤖 Analysis Model")
+            
+            selected_model = st.selectbox(
+                "Select model for analysis:",
+                options=_MODEL_OPTIONS,
+                format_func=lambda x: ANALYSIS_MODELS[x].name,
+                index=_MODEL_OPTIONS.index(settings["model"]),
+                help="Perplexity Sonar is always used for research. "
+                     "This model is used for analysis."
+            )
+            
+            st.markdown("---")
+            
+            # Number of ICPs
+            st.subheader("👥 ICP Settings")
+            num_icps = st.slider(
+                "Number of ICPs to generate:",
+                min_value=APP_CONFIG["min_icps"],
+                max_value=APP_CONFIG["max_icps"],
+                value=settings["num_icps"],
+                help="Generate 2-5 Ideal Customer Profiles"
+            )
+            batch_size = st.slider(
+                "ICPs per pain analysis request:",
+                min_value=1,
+                max_value=APP_CONFIG["max_batch_size"],
+                value=settings["batch_size"],
+                help="Analyze several ICPs' pain points in one LLM call (1 = one call per ICP)"
+            )
+            
+            if st.form_submit_button("Apply", use_container_width=True):
+                settings = st.session_state.settings = {
+                    "model": selected_model,
+                    "num_icps": num_icps,
+                    "batch_size": batch_size
+                }
         
-        # Show model info
-        model_config = ANALYSIS_MODELS[selected_model]
+        # Show info for the applied model
+        model_config = ANALYSIS_MODELS[settings["model"]]
         st.caption(f"*{model_config.description}*")
         st.caption(
             f"Cost: ${model_config.input_price_per_million}/M input, "
@@ -95,22 +166,9 @@ def render_sidebar():
         
         st.markdown("---")
         
-        # Number of ICPs
-        st.subheader("👥 ICP Settings")
-        num_icps = st.slider(
-            "Number of ICPs to generate:",
-            min_value=APP_CONFIG["min_icps"],
-            max_value=APP_CONFIG["max_icps"],
-            value=APP_CONFIG["default_num_icps"],
-            help="Generate 2-5 Ideal Customer Profiles"
-        )
-        
-        st.markdown("---")
-        
         # Cost Summary
-        if st.session_state.cost_tracker.usage_log:
+        if summary["total_requests"]:
             st.subheader("💰 Cost Summary")
-            summary = st.session_state.cost_tracker.get_summary()
             st.metric(
                 "Total Cost",
                 f"${summary['total_cost']:.4f}"
@@ -123,10 +181,12 @@ def render_sidebar():
             with st.expander("Breakdown by Model"):
                 for model, data in summary['by_model'].items():
                     short_name = model.split('/')[-1]
-                    st.write(f"**{short_name}**")
-                    st.write(f"  - Requests: {data['requests']}")
-                    st.write(f"  - Tokens: {data['total_tokens']:,}")
-                    st.write(f"  - Cost: ${data['cost']:.4f}")
+                    st.markdown(
+                        f"**{short_name}**\n"
+                        f"  - Requests: {data['requests']}\n"
+                        f"  - Tokens: {data['total_tokens']:,}\n"
+                        f"  - Cost: ${data['cost']:.4f}"
+                    )
         
         st.markdown("---")
         
@@ -135,8 +195,6 @@ def render_sidebar():
             for key in list(st.session_state.keys()):
                 del st.session_state[key]
             st.rerun()
-        
-        return selected_model, num_icps
 
 
 # ===== Input Form =====
@@ -226,6 +284,27 @@ def render_input_form(num_icps: int) -> Optional[ClientInput]:
             if not industry:
                 errors.append("Industry is required")
             
+            # Parse additional URLs
+            url_list = [
+                u.strip() for u in additional_urls.split('\n')
+                if u.strip()
+            ]
+            
+            # Catch malformed URLs before they reach the pipeline
+            for label, url in (
+                ("Website URL", website_url),
+                ("About Page URL", about_page_url),
+                ("Products/Services Page URL", products_url)
+            ):
+                if url and not _URL_RE.match(url.strip()):
+                    errors.append(
+                        f"Invalid {label}: {url} "
+                        f"(include http:// or https://)"
+                    )
+            for url in url_list:
+                if not _URL_RE.match(url):
+                    errors.append(f"Invalid additional URL: {url}")
+            
             if errors:
                 for error in errors:
                     st.error(error)
@@ -238,17 +317,11 @@ def render_input_form(num_icps: int) -> Optional[ClientInput]:
                 "Both B2B and B2C": BusinessModelType.BOTH
             }
             
-            # Parse additional URLs
-            url_list = [
-                u.strip() for u in additional_urls.split('\n')
-                if u.strip()
-            ]
-            
             return ClientInput(
                 client_name=client_name,
-                website_url=website_url,
-                about_page_url=about_page_url or None,
-                products_services_url=products_url or None,
+                website_url=website_url.strip(),
+                about_page_url=about_page_url.strip() or None,
+                products_services_url=products_url.strip() or None,
                 additional_urls=url_list,
                 industry=industry,
                 business_model=bm_map[business_model],
@@ -263,44 +336,370 @@ def render_input_form(num_icps: int) -> Optional[ClientInput]:
 
 # ===== Progress Display =====
 
+def _stage_entries(stage_id: str, outputs: dict) -> list:
+    """
+    Progress entries for a pipeline stage as (icp_number, output) pairs.
+    
+    Per-ICP stages report as "<stage_id>_<n>"; whole-run stages use
+    icp_number None.
+    """
+    if stage_id in outputs:
+        return [(None, outputs[stage_id])]
+    
+    prefix = f"{stage_id}_"
+    return sorted(
+        (int(key[len(prefix):]), output)
+        for key, output in outputs.items()
+        if key.startswith(prefix)
+    )
+
+
 def render_progress():
-    """Render the research progress."""
+    """Render the research progress, one status container per stage."""
     if not st.session_state.is_running:
         return
     
     st.header("🔄 Research in Progress")
     
-    progress_container = st.container()
+    outputs = st.session_state.stage_outputs
+    num_icps = outputs.get("audience_research", {}).get("data", {}).get(
+        "num_icps"
+    )
     
-    with progress_container:
-        for stage in PIPELINE_STAGES:
-            stage_id = stage["id"]
-            status = st.session_state.stage_outputs.get(stage_id, {}).get(
-                "status", "pending"
-            )
+    for stage in PIPELINE_STAGES:
+        entries = _stage_entries(stage["id"], outputs)
+        
+        if not entries:
+            st.write(f"⬜ {stage['name']}: Pending")
+            continue
+        
+        statuses = [output.get("status") for _, output in entries]
+        expected = 1 if entries[0][0] is None else (num_icps or len(entries))
+        
+        if "running" in statuses or len(entries) < expected:
+            state = "running"
+            label = f"{stage['name']}: {stage['description']}..."
+        elif "error" in statuses:
+            state = "error"
+            label = f"{stage['name']}: Failed"
+        else:
+            state = "complete"
+            label = f"{stage['name']}: Complete"
+        
+        with st.status(label, state=state, expanded=(state != "complete")):
+            lines = []
+            for icp_number, output in entries:
+                prefix = f"**ICP {icp_number}:** " if icp_number else ""
+                if output.get("error"):
+                    lines.append(f"- {prefix}❌ {output['error']}")
+                elif output.get("data"):
+                    details = ", ".join(
+                        f"{key.replace('_', ' ')}: {value}"
+                        for key, value in output["data"].items()
+                    )
+                    lines.append(f"- {prefix}{details}")
+                elif output.get("status") == "running":
+                    lines.append(f"- {prefix}In progress...")
             
-            if status == "running":
-                st.info(f"⏳ {stage['name']}: {stage['description']}...")
-            elif status == "complete":
-                st.success(f"✅ {stage['name']}: Complete")
-            elif status == "error":
-                error_msg = st.session_state.stage_outputs[stage_id].get(
-                    "error", "Unknown error"
-                )
-                st.error(f"❌ {stage['name']}: {error_msg}")
-            else:
-                st.write(f"⬜ {stage['name']}: Pending")
+            if lines:
+                st.markdown("\n".join(lines))
 
 
 # ===== Results Display =====
 
-def render_results():
+# Journey map stages in display order: (label, JourneyMap attribute)
+_JOURNEY_STAGE_FIELDS = (
+    ("Awareness", "awareness_stage"),
+    ("Consideration", "consideration_stage"),
+    ("Decision", "decision_stage"),
+    ("Onboarding", "onboarding_stage"),
+    ("Expansion", "expansion_stage")
+)
+
+@st.cache_data(show_spinner=False)
+def _flatten_results(results_json: bytes, _results: ResearchResults) -> dict:
+    """
+    Build a plain-dict view of the results for the result tabs.
+    
+    Memoized on the serialized results, so the Pydantic tree is walked and
+    its lists sliced/formatted once rather than on every rerun.
+    """
+    view = {
+        "profile": None,
+        "icps": [],
+        "value_propositions": [],
+        "pain_taxonomies": [],
+        "journeys": []
+    }
+    
+    profile = _results.company_profile
+    if profile:
+        view["profile"] = {
+            "name": profile.name,
+            "industry": profile.industry,
+            "business_model": profile.business_model.value,
+            "overview": profile.overview,
+            "products": [
+                (ps.name, ps.description, list(ps.features))
+                for ps in profile.products_services
+            ],
+            "value_propositions": list(profile.stated_value_propositions),
+            "competitors": [
+                (comp.name, comp.description or "")
+                for comp in profile.competitors
+            ]
+        }
+    
+    for icp_result in _results.icps:
+        icp = icp_result.icp
+        demographics = icp.demographics
+        psychographics = icp.psychographics
+        
+        demographics_lines = []
+        if demographics.company_size:
+            demographics_lines.append(
+                f"Company Size: {demographics.company_size}"
+            )
+        if demographics.job_titles:
+            demographics_lines.append(
+                f"Job Titles: {demographics.job_titles_csv}"
+            )
+        if demographics.industry_verticals:
+            demographics_lines.append(
+                f"Industries: {demographics.industry_verticals_csv}"
+            )
+        
+        psychographics_lines = []
+        if psychographics.decision_style:
+            psychographics_lines.append(
+                f"Decision Style: {psychographics.decision_style.value}"
+            )
+        if psychographics.risk_tolerance:
+            psychographics_lines.append(
+                f"Risk Tolerance: {psychographics.risk_tolerance.value}"
+            )
+        if psychographics.core_values:
+            psychographics_lines.append(
+                f"Values: {', '.join(psychographics.core_values[:3])}"
+            )
+        
+        view["icps"].append({
+            "title": f"👤 {icp.icp_name} ({icp.segment_priority})",
+            "one_liner": icp.one_liner,
+            "demographics_lines": demographics_lines,
+            "psychographics_lines": psychographics_lines,
+            "top_motivations": [m.statement for m in icp.motivations[:3]],
+            "top_pains": [
+                f"{p.statement} (Severity: {p.severity}/10)"
+                for p in icp.pain_points[:3]
+            ],
+            "narrative": icp.detailed_narrative
+        })
+        
+        vp = icp_result.value_proposition
+        if vp:
+            view["value_propositions"].append({
+                "title": f"💎 VP for {icp.icp_name}",
+                "statement": vp.value_proposition_statement,
+                "fit_score": vp.fit_score,
+                "pain_relievers": [
+                    f"**{pr.pain_addressed}**: {pr.how_relieved}"
+                    for pr in vp.pain_relievers[:5]
+                ],
+                "gain_creators": [
+                    f"**{gc.gain_created}**: {gc.how_created}"
+                    for gc in vp.gain_creators[:5]
+                ],
+                "differentiators": list(vp.unique_differentiators)
+            })
+        
+        pt = icp_result.pain_taxonomy
+        if pt:
+            fa = pt.forces_analysis
+            view["pain_taxonomies"].append({
+                "title": f"😰 Pain Points for {icp.icp_name}",
+                "columns": [
+                    (label, [f"{p.statement} ({p.severity}/10)" for p in pains[:5]])
+                    for label, pains in (
+                        ("Functional Pains", pt.functional_pains),
+                        ("Financial Pains", pt.financial_pains),
+                        ("Emotional Pains", pt.emotional_pains)
+                    )
+                ],
+                "forces": (
+                    (fa.net_force_assessment, fa.recommended_focus)
+                    if fa else None
+                )
+            })
+        
+        jm = icp_result.journey_map
+        if jm:
+            view["journeys"].append({
+                "title": f"🗺️ Journey for {icp.icp_name}",
+                "timeline": jm.overall_timeline,
+                "stages": [
+                    {
+                        "name": name,
+                        "objective": stage.objective,
+                        "themes": ", ".join(stage.content_themes[:3]),
+                        "ideas": [
+                            f"{idea.title} ({idea.format})"
+                            for idea in stage.content_ideas[:2]
+                        ]
+                    }
+                    for name, attr in _JOURNEY_STAGE_FIELDS
+                    if (stage := getattr(jm, attr))
+                ]
+            })
+    
+    return view
+
+
+# ===== Result Tabs =====
+# Each tab is a fragment so interacting inside one tab only reruns that tab.
+
+def _bullets(items) -> str:
+    """Join items into one Markdown bullet list (a single element)."""
+    return "\n".join(f"- {item}" for item in items)
+
+
+@st.fragment
+def _render_company_tab(profile: Optional[dict]):
+    """Render the Company Profile tab."""
+    if profile:
+        st.subheader(profile["name"])
+        st.write(f"**Industry:** {profile['industry']}")
+        st.write(f"**Business Model:** {profile['business_model']}")
+        
+        st.markdown("### Overview")
+        st.write(profile["overview"])
+        
+        if profile["products"]:
+            st.markdown("### Products & Services")
+            for name, description, features in profile["products"]:
+                with st.expander(name):
+                    st.write(description)
+                    if features:
+                        st.write("**Features:**")
+                        st.markdown(_bullets(features))
+        
+        if profile["value_propositions"]:
+            st.markdown("### Stated Value Propositions")
+            st.markdown(_bullets(profile["value_propositions"]))
+        
+        if profile["competitors"]:
+            st.markdown("### Competitors")
+            st.markdown(_bullets(
+                f"**{name}**: {description}"
+                for name, description in profile["competitors"]
+            ))
+
+
+@st.fragment
+def _render_icps_tab(icps: list):
+    """Render the ICPs tab."""
+    for i, icp in enumerate(icps):
+        with st.expander(icp["title"], expanded=(i == 0)):
+            st.write(f"*{icp['one_liner']}*")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("**Demographics**")
+                if icp["demographics_lines"]:
+                    st.markdown("  \n".join(icp["demographics_lines"]))
+            
+            with col2:
+                st.markdown("**Psychographics**")
+                if icp["psychographics_lines"]:
+                    st.markdown("  \n".join(icp["psychographics_lines"]))
+            
+            if icp["top_motivations"]:
+                st.markdown("**Top Motivations**")
+                st.markdown(_bullets(icp["top_motivations"]))
+            
+            if icp["top_pains"]:
+                st.markdown("**Top Pain Points**")
+                st.markdown(_bullets(icp["top_pains"]))
+            
+            if icp["narrative"]:
+                st.markdown("**Detailed Profile**")
+                st.write(icp["narrative"])
+
+
+@st.fragment
+def _render_vp_tab(value_propositions: list):
+    """Render the Value Propositions tab."""
+    for i, vp in enumerate(value_propositions):
+        with st.expander(vp["title"], expanded=(i == 0)):
+            if vp["statement"]:
+                st.info(vp["statement"])
+            
+            if vp["fit_score"]:
+                st.metric("Fit Score", f"{vp['fit_score']}/100")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("**Pain Relievers**")
+                st.markdown(_bullets(vp["pain_relievers"]))
+            
+            with col2:
+                st.markdown("**Gain Creators**")
+                st.markdown(_bullets(vp["gain_creators"]))
+            
+            if vp["differentiators"]:
+                st.markdown("**Unique Differentiators**")
+                st.markdown(_bullets(vp["differentiators"]))
+
+
+@st.fragment
+def _render_pains_tab(pain_taxonomies: list):
+    """Render the Pain Points tab."""
+    for i, pt in enumerate(pain_taxonomies):
+        with st.expander(pt["title"], expanded=(i == 0)):
+            for col, (label, pains) in zip(st.columns(3), pt["columns"]):
+                with col:
+                    st.markdown(f"**{label}**")
+                    st.markdown(_bullets(pains))
+            
+            if pt["forces"]:
+                assessment, focus = pt["forces"]
+                st.markdown("**Forces Analysis**")
+                st.write(f"Assessment: {assessment}")
+                st.write(f"Recommended Focus: {focus}")
+
+
+@st.fragment
+def _render_journeys_tab(journeys: list):
+    """Render the Journey Maps tab."""
+    for i, journey in enumerate(journeys):
+        with st.expander(journey["title"], expanded=(i == 0)):
+            st.write(f"**Timeline:** {journey['timeline']}")
+            
+            for stage in journey["stages"]:
+                with st.container():
+                    st.markdown(f"#### {stage['name']}")
+                    st.write(f"*{stage['objective']}*")
+                    
+                    if stage["themes"]:
+                        st.write(f"**Themes:** {stage['themes']}")
+                    
+                    if stage["ideas"]:
+                        st.write("**Content Ideas:**")
+                        st.markdown(_bullets(stage["ideas"]))
+
+
+def render_results(summary: dict):
     """Render the research results."""
     results: ResearchResults = st.session_state.results
     
     if not results:
         return
     
+    results_json = results.to_bytes()
+    view = _flatten_results(results_json, results)
+    
     st.header("📊 Research Results")
     
     # Tabs for different sections
@@ -315,217 +714,23 @@ def render_results():
     
     # Company Profile Tab
     with tabs[0]:
-        if results.company_profile:
-            profile = results.company_profile
-            st.subheader(profile.name)
-            st.write(f"**Industry:** {profile.industry}")
-            st.write(f"**Business Model:** {profile.business_model.value}")
-            
-            st.markdown("### Overview")
-            st.write(profile.overview)
-            
-            if profile.products_services:
-                st.markdown("### Products & Services")
-                for ps in profile.products_services:
-                    with st.expander(ps.name):
-                        st.write(ps.description)
-                        if ps.features:
-                            st.write("**Features:**")
-                            for f in ps.features:
-                                st.write(f"- {f}")
-            
-            if profile.stated_value_propositions:
-                st.markdown("### Stated Value Propositions")
-                for vp in profile.stated_value_propositions:
-                    st.write(f"- {vp}")
-            
-            if profile.competitors:
-                st.markdown("### Competitors")
-                for comp in profile.competitors:
-                    st.write(f"- **{comp.name}**: {comp.description or ''}")
+        _render_company_tab(view["profile"])
     
     # ICPs Tab
     with tabs[1]:
-        if results.icps:
-            for icp_result in results.icps:
-                icp = icp_result.icp
-                with st.expander(
-                    f"👤 {icp.icp_name} ({icp.segment_priority})",
-                    expanded=True
-                ):
-                    st.write(f"*{icp.one_liner}*")
-                    
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        st.markdown("**Demographics**")
-                        if icp.demographics.company_size:
-                            st.write(
-                                f"Company Size: {icp.demographics.company_size}"
-                            )
-                        if icp.demographics.job_titles:
-                            st.write(
-                                f"Job Titles: {', '.join(icp.demographics.job_titles)}"
-                            )
-                        if icp.demographics.industry_verticals:
-                            st.write(
-                                f"Industries: "
-                                f"{', '.join(icp.demographics.industry_verticals)}"
-                            )
-                    
-                    with col2:
-                        st.markdown("**Psychographics**")
-                        if icp.psychographics.decision_style:
-                            st.write(
-                                f"Decision Style: "
-                                f"{icp.psychographics.decision_style.value}"
-                            )
-                        if icp.psychographics.risk_tolerance:
-                            st.write(
-                                f"Risk Tolerance: "
-                                f"{icp.psychographics.risk_tolerance.value}"
-                            )
-                        if icp.psychographics.core_values:
-                            st.write(
-                                f"Values: "
-                                f"{', '.join(icp.psychographics.core_values[:3])}"
-                            )
-                    
-                    if icp.motivations:
-                        st.markdown("**Top Motivations**")
-                        for m in icp.motivations[:3]:
-                            st.write(f"- {m.statement}")
-                    
-                    if icp.pain_points:
-                        st.markdown("**Top Pain Points**")
-                        for p in icp.pain_points[:3]:
-                            st.write(f"- {p.statement} (Severity: {p.severity}/10)")
-                    
-                    if icp.detailed_narrative:
-                        st.markdown("**Detailed Profile**")
-                        st.write(icp.detailed_narrative)
+        _render_icps_tab(view["icps"])
     
     # Value Propositions Tab
     with tabs[2]:
-        if results.icps:
-            for icp_result in results.icps:
-                if icp_result.value_proposition:
-                    vp = icp_result.value_proposition
-                    with st.expander(
-                        f"💎 VP for {icp_result.icp.icp_name}",
-                        expanded=True
-                    ):
-                        if vp.value_proposition_statement:
-                            st.info(vp.value_proposition_statement)
-                        
-                        if vp.fit_score:
-                            st.metric("Fit Score", f"{vp.fit_score}/100")
-                        
-                        col1, col2 = st.columns(2)
-                        
-                        with col1:
-                            st.markdown("**Pain Relievers**")
-                            for pr in vp.pain_relievers[:5]:
-                                st.write(
-                                    f"- **{pr.pain_addressed}**: {pr.how_relieved}"
-                                )
-                        
-                        with col2:
-                            st.markdown("**Gain Creators**")
-                            for gc in vp.gain_creators[:5]:
-                                st.write(
-                                    f"- **{gc.gain_created}**: {gc.how_created}"
-                                )
-                        
-                        if vp.unique_differentiators:
-                            st.markdown("**Unique Differentiators**")
-                            for d in vp.unique_differentiators:
-                                st.write(f"- {d}")
+        _render_vp_tab(view["value_propositions"])
     
     # Pain Points Tab
     with tabs[3]:
-        if results.icps:
-            for icp_result in results.icps:
-                if icp_result.pain_taxonomy:
-                    pt = icp_result.pain_taxonomy
-                    with st.expander(
-                        f"😰 Pain Points for {icp_result.icp.icp_name}",
-                        expanded=True
-                    ):
-                        col1, col2, col3 = st.columns(3)
-                        
-                        with col1:
-                            st.markdown("**Functional Pains**")
-                            for p in pt.functional_pains[:5]:
-                                st.write(
-                                    f"- {p.statement} "
-                                    f"({p.severity}/10)"
-                                )
-                        
-                        with col2:
-                            st.markdown("**Financial Pains**")
-                            for p in pt.financial_pains[:5]:
-                                st.write(
-                                    f"- {p.statement} "
-                                    f"({p.severity}/10)"
-                                )
-                        
-                        with col3:
-                            st.markdown("**Emotional Pains**")
-                            for p in pt.emotional_pains[:5]:
-                                st.write(
-                                    f"- {p.statement} "
-                                    f"({p.severity}/10)"
-                                )
-                        
-                        if pt.forces_analysis:
-                            st.markdown("**Forces Analysis**")
-                            fa = pt.forces_analysis
-                            st.write(
-                                f"Assessment: {fa.net_force_assessment}"
-                            )
-                            st.write(
-                                f"Recommended Focus: {fa.recommended_focus}"
-                            )
+        _render_pains_tab(view["pain_taxonomies"])
     
     # Journey Maps Tab
     with tabs[4]:
-        if results.icps:
-            for icp_result in results.icps:
-                if icp_result.journey_map:
-                    jm = icp_result.journey_map
-                    with st.expander(
-                        f"🗺️ Journey for {icp_result.icp.icp_name}",
-                        expanded=True
-                    ):
-                        st.write(f"**Timeline:** {jm.overall_timeline}")
-                        
-                        stages = [
-                            ("Awareness", jm.awareness_stage),
-                            ("Consideration", jm.consideration_stage),
-                            ("Decision", jm.decision_stage),
-                            ("Onboarding", jm.onboarding_stage),
-                            ("Expansion", jm.expansion_stage)
-                        ]
-                        
-                        for stage_name, stage in stages:
-                            if stage:
-                                with st.container():
-                                    st.markdown(f"#### {stage_name}")
-                                    st.write(f"*{stage.objective}*")
-                                    
-                                    if stage.content_themes:
-                                        st.write(
-                                            f"**Themes:** "
-                                            f"{', '.join(stage.content_themes[:3])}"
-                                        )
-                                    
-                                    if stage.content_ideas[:2]:
-                                        st.write("**Content Ideas:**")
-                                        for idea in stage.content_ideas[:2]:
-                                            st.write(
-                                                f"- {idea.title} ({idea.format})"
-                                            )
+        _render_journeys_tab(view["journeys"])
     
     # Export Tab
     with tabs[5]:
@@ -534,34 +739,27 @@ def render_results():
         col1, col2 = st.columns(2)
         
         with col1:
-            if st.button("📄 Download Markdown", use_container_width=True):
-                # Generate markdown export
-                from app.export.markdown_generator import generate_markdown
-                md_content = generate_markdown(results)
-                st.download_button(
-                    "📥 Download .md File",
-                    data=md_content,
-                    file_name=f"{results.client_input.client_name}_research.md",
-                    mime="text/markdown"
-                )
+            st.download_button(
+                "📄 Download Markdown",
+                data=_export_markdown(results_json, results),
+                file_name=f"{results.client_input.client_name}_research.md",
+                mime="text/markdown",
+                use_container_width=True
+            )
         
         with col2:
-            if st.button("📝 Download DOCX", use_container_width=True):
-                # Generate DOCX export
-                from app.export.docx_generator import generate_docx
-                docx_bytes = generate_docx(results)
-                st.download_button(
-                    "📥 Download .docx File",
-                    data=docx_bytes,
-                    file_name=f"{results.client_input.client_name}_research.docx",
-                    mime="application/vnd.openxmlformats-officedocument"
-                         ".wordprocessingml.document"
-                )
+            st.download_button(
+                "📝 Download DOCX",
+                data=_export_docx(results_json, results),
+                file_name=f"{results.client_input.client_name}_research.docx",
+                mime="application/vnd.openxmlformats-officedocument"
+                     ".wordprocessingml.document",
+                use_container_width=True
+            )
         
         # Cost summary
         st.markdown("---")
         st.subheader("💰 Session Cost Summary")
-        summary = st.session_state.cost_tracker.get_summary()
         
         col1, col2, col3 = st.columns(3)
         col1.metric("Total Cost", f"${summary['total_cost']:.4f}")
@@ -569,14 +767,201 @@ def render_results():
         col3.metric("Output Tokens", f"{summary['total_tokens']['output']:,}")
 
 
+# ===== Export =====
+
+@st.cache_data(show_spinner=False)
+def _export_markdown(results_json: bytes, _results: ResearchResults) -> str:
+    """Markdown report, memoized on the serialized results."""
+    return generate_markdown(_results)
+
+
+@st.cache_data(show_spinner=False)
+def _export_docx(results_json: bytes, _results: ResearchResults) -> bytes:
+    """DOCX report, memoized on the serialized results."""
+    return generate_docx(_results)
+
+
+# ===== Background Research =====
+
+class _UncachedResults(Exception):
+    """Carries results out of the cached runner without caching them."""
+    
+    def __init__(self, results: ResearchResults):
+        super().__init__(results.error)
+        self.results = results
+
+
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def _cached_run_research(
+    client_key: tuple,
+    model: str,
+    batch_size: int,
+    _client_input: ClientInput,
+    _cost_tracker: "CostTracker",
+    _progress_callback=None
+) -> ResearchResults:
+    """
+    Run the full pipeline, memoized on the client input's cache key and
+    settings so resubmitting identical input skips every LLM call.
+    
+    Underscore-prefixed arguments are excluded from the cache key. Runs
+    that end with an error are not cached.
+    """
+    with checkout_orchestrator(
+        model, _cost_tracker, batch_size
+    ) as orchestrator:
+        results = orchestrator.run_research(
+            _client_input,
+            progress_callback=_progress_callback
+        )
+    if results.error:
+        raise _UncachedResults(results)
+    return results
+
+
+def _run_research(
+    client_input: ClientInput,
+    model: str,
+    batch_size: int,
+    cost_tracker: "CostTracker",
+    progress_callback=None
+) -> ResearchResults:
+    """Run the cached pipeline, returning partial results on failure."""
+    try:
+        results = _cached_run_research(
+            client_input.cache_key,
+            model,
+            batch_size,
+            client_input,
+            cost_tracker,
+            progress_callback
+        )
+    except _UncachedResults as e:
+        return e.results
+    
+    # A cache hit carries the cost summary of whichever session ran it
+    # first; report this caller's own usage instead (st.cache_data hands
+    # back a copy, so the cached value is untouched)
+    results.cost_summary = cost_tracker.get_summary()
+    return results
+
+
+def start_research(
+    client_input: ClientInput,
+    selected_model: str,
+    batch_size: int
+):
+    """
+    Start the research pipeline on a background thread.
+    
+    The worker only pushes progress updates onto a queue; the script thread
+    drains it on each rerun (session_state is not safe to touch from other
+    threads).
+    """
+    updates: queue.Queue = queue.Queue()
+    
+    def progress_callback(stage_id: str, status: str, data=None, error=None):
+        updates.put((stage_id, status, data, error))
+    
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(
+        _run_research,
+        client_input,
+        selected_model,
+        batch_size,
+        st.session_state.cost_tracker,
+        progress_callback
+    )
+    # Let the worker thread exit once the run finishes
+    executor.shutdown(wait=False)
+    
+    st.session_state.future = future
+    st.session_state.progress_queue = updates
+    st.session_state.stage_outputs = {}
+    st.session_state.is_running = True
+
+
+# Progress polling cadence while a run is in flight (seconds)
+_POLL_INTERVAL = 0.5
+_MAX_IDLE_POLL = 3.0
+
+
+def wait_for_progress():
+    """
+    Wait until the background run has something new to show.
+    
+    Stage outputs only change when updates arrive on the queue, so there is
+    no point rerunning (and re-rendering every stage) while it is empty.
+    The wait is capped so widget interactions are still picked up promptly.
+    
+    Polling reruns are debounced to at most one per _POLL_INTERVAL, measured
+    from the previous poll, so reruns triggered by widgets in between do not
+    stack extra polls on top.
+    """
+    updates = st.session_state.progress_queue
+    future = st.session_state.future
+    now = time.monotonic()
+    deadline = now + _MAX_IDLE_POLL
+    
+    since_last_poll = now - st.session_state.get("_last_poll", 0.0)
+    if since_last_poll < _POLL_INTERVAL:
+        time.sleep(_POLL_INTERVAL - since_last_poll)
+    while (
+        updates is not None
+        and updates.empty()
+        and future is not None
+        and not future.done()
+        and time.monotonic() < deadline
+    ):
+        time.sleep(_POLL_INTERVAL)
+    
+    st.session_state["_last_poll"] = time.monotonic()
+
+
+def poll_research():
+    """Apply queued progress updates and collect results when done."""
+    updates = st.session_state.progress_queue
+    while updates is not None:
+        try:
+            stage_id, status, data, error = updates.get_nowait()
+        except queue.Empty:
+            break
+        output = st.session_state.stage_outputs.setdefault(stage_id, {})
+        output["status"] = status
+        if data:
+            output["data"] = data
+        if error:
+            output["error"] = error
+    
+    future = st.session_state.future
+    if future is None or not future.done():
+        return
+    
+    st.session_state.future = None
+    st.session_state.progress_queue = None
+    st.session_state.is_running = False
+    try:
+        st.session_state.results = future.result()
+    except Exception as e:
+        st.error(f"Research failed: {str(e)}")
+
+
 # ===== Main Function =====
 
 def main():
     """Main application entry point."""
     init_session_state()
     
+    # Pick up progress/results from an in-flight background run
+    if st.session_state.is_running:
+        poll_research()
+    
+    # Cost summary, shared by the sidebar and results view
+    summary = st.session_state.cost_tracker.summary
+    
     # Sidebar
-    selected_model, num_icps = render_sidebar()
+    render_sidebar(summary)
+    settings = st.session_state.settings
     
     # Header
     st.title("🧠 Cognitive Resonance Engine")
@@ -587,55 +972,40 @@ def main():
     
     # Show results if available
     if st.session_state.results:
-        render_results()
+        render_results(summary)
         
         if st.button("🔄 Start New Research"):
             st.session_state.results = None
             st.session_state.stage_outputs = {}
             st.rerun()
     
-    # Show progress if running
+    # Show progress if running, and rerun once there is news
     elif st.session_state.is_running:
         render_progress()
+        wait_for_progress()
+        st.rerun()
     
     # Show input form
     else:
-        client_input = render_input_form(num_icps)
+        client_input = render_input_form(settings["num_icps"])
         
         if client_input:
-            # Start research
-            st.session_state.is_running = True
+            # Start research in the background and switch to progress view
             st.session_state.session.client_input = client_input
             
             with st.spinner("Initializing research pipeline..."):
                 try:
-                    # Create orchestrator
-                    orchestrator = ResearchOrchestrator(
-                        analysis_model=selected_model,
-                        cost_tracker=st.session_state.cost_tracker
-                    )
-                    
-                    # Run research with progress updates
-                    def progress_callback(stage_id: str, status: str, data=None):
-                        if stage_id not in st.session_state.stage_outputs:
-                            st.session_state.stage_outputs[stage_id] = {}
-                        st.session_state.stage_outputs[stage_id]["status"] = status
-                        if data:
-                            st.session_state.stage_outputs[stage_id]["data"] = data
-                    
-                    results = orchestrator.run_research(
+                    start_research(
                         client_input,
-                        progress_callback=progress_callback
+                        settings["model"],
+                        settings["batch_size"]
                     )
-                    
-                    st.session_state.results = results
-                    st.session_state.is_running = False
-                    st.rerun()
-                    
                 except Exception as e:
                     st.session_state.is_running = False
                     st.error(f"Research failed: {str(e)}")
                     raise e
+            
+            st.rerun()
 
 
 if __name__ == "__main__":
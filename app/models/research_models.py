@@ -2,14 +2,83 @@
 Cognitive Resonance Engine - Data Models
 ========================================
 Pydantic models for all research data structures.
+
+The models stay on Pydantic v2 rather than a lighter struct library: the
+app relies on its JSON round-trip (model_dump_json / model_validate_json as
+cache keys and loaders), field constraints and model_construct. JSON
+decoding goes through pydantic-core directly (model_validate_json) instead
+of json.loads + model_validate.
+
+The module is also left uncompiled (no mypyc/Cython build): models built by
+Pydantic's metaclass can't be native compiled classes, and validation and
+serialization already run in compiled pydantic-core. Keep annotations
+evaluated at runtime (no ``from __future__ import annotations``) regardless,
+since Pydantic resolves them.
 """
 
-from typing import List, Dict, Optional, Any
-from pydantic import BaseModel, Field
-from datetime import datetime
+from dataclasses import dataclass, field, is_dataclass
+from functools import cached_property, lru_cache
+from typing import (
+    Annotated, List, Dict, Literal, Optional, Any, Type, TypeVar, Union,
+    get_args, get_origin
+)
+from pydantic import (
+    AfterValidator, AliasChoices, BaseModel, ConfigDict, Field, PrivateAttr,
+    TypeAdapter, computed_field, field_validator, model_validator
+)
+from pathlib import Path
+import sys
+import time
+
+import orjson
 from enum import Enum
 
 
+# ===== Base Model =====
+
+class FastBase(BaseModel):
+    """
+    Shared base for all research models.
+    
+    Core schemas are built lazily on first validation instead of at import,
+    so importing this module (and every Streamlit cold start) doesn't pay
+    for the ~30 models, many of which are rarely constructed.
+    """
+    model_config = ConfigDict(
+        defer_build=True,
+        extra="ignore",
+        validate_default=False
+    )
+    
+    def to_bytes(self) -> bytes:
+        """
+        Serialize to JSON bytes in one pydantic-core pass.
+        
+        Same output as model_dump_json() but calls the compiled serializer
+        directly and skips the decode to str. Memoized on frozen models
+        (the bytes are immutable, so callers can't corrupt the cached copy;
+        in-place edits to a frozen model's nested lists aren't tracked).
+        """
+        if self.model_config.get("frozen"):
+            return self._frozen_bytes
+        return self.__pydantic_serializer__.to_json(self)
+    
+    @cached_property
+    def _frozen_bytes(self) -> bytes:
+        return self.__pydantic_serializer__.to_json(self)
+
+
+# Score constrained to 1-10; usable on plain dataclass fields. Only checked
+# when the dataclass is built from a dict by Pydantic (parse_list, or a raw
+# dict inside a parent model); a ready-made dataclass instance passed to a
+# parent is not re-validated, so ingest code goes through parse_list
+Score = Annotated[int, Field(ge=1, le=10)]
+
+# Low-cardinality label (category, frequency, format, ...); interned on
+# validation so the many repeats across a result share one string object
+Label = Annotated[str, AfterValidator(sys.intern)]
+
+
 # ===== Enums =====
 
 class BusinessModelType(str, Enum):
@@ -42,8 +111,16 @@ class PainSeverity(str, Enum):
 
 # ===== Input Models =====
 
-class ClientInput(BaseModel):
-    """User input for client information."""
+class ClientInput(FastBase):
+    """
+    User input for client information.
+    
+    Frozen so a submitted input can be shared and used as a cache key
+    directly; the key is computed once at construction and reused by
+    __hash__.
+    """
+    model_config = ConfigDict(frozen=True)
+    
     client_name: str = Field(..., description="Company/Brand name")
     website_url: str = Field(..., description="Main website URL")
     about_page_url: Optional[str] = Field(None, description="About Us page URL")
@@ -67,44 +144,84 @@ class ClientInput(BaseModel):
         None, description="Any additional context"
     )
     num_icps: int = Field(default=3, ge=2, le=5, description="Number of ICPs")
+    
+    _cache_key: tuple = PrivateAttr(default=())
+    
+    def model_post_init(self, __context: Any) -> None:
+        # Built eagerly: __eq__ compares private attrs, so a lazily filled
+        # key would make equal inputs unequal once only one was hashed
+        self._cache_key = (
+            self.client_name,
+            self.website_url,
+            self.about_page_url,
+            self.products_services_url,
+            tuple(self.additional_urls),
+            self.industry,
+            self.business_model.value,
+            self.target_market,
+            self.known_competitors,
+            self.additional_context,
+            self.num_icps,
+        )
+    
+    @property
+    def cache_key(self) -> tuple:
+        """Hashable tuple of every field."""
+        return self._cache_key
+    
+    def __hash__(self) -> int:
+        return hash(self.cache_key)
 
 
 # ===== Company Profile Models =====
 
-class Competitor(BaseModel):
+@dataclass(slots=True)
+class Competitor:
     """Competitor information."""
     name: str
     website: Optional[str] = None
     description: Optional[str] = None
-    key_differentiators: List[str] = Field(default_factory=list)
-    strengths: List[str] = Field(default_factory=list)
-    weaknesses: List[str] = Field(default_factory=list)
+    key_differentiators: List[str] = field(default_factory=list)
+    strengths: List[str] = field(default_factory=list)
+    weaknesses: List[str] = field(default_factory=list)
     target_audience: Optional[str] = None
     market_position: Optional[str] = None
 
 
-class ProductService(BaseModel):
+@dataclass(slots=True)
+class ProductService:
     """Product or service offering."""
     name: str
     description: str
-    features: List[str] = Field(default_factory=list)
+    features: List[str] = field(default_factory=list)
     target_user: Optional[str] = None
     target_audience: Optional[str] = None
-    pricing_tier: Optional[str] = None
-    unique_aspects: List[str] = Field(default_factory=list)
+    pricing_tier: Optional[Label] = None
+    unique_aspects: List[str] = field(default_factory=list)
 
 
-class BrandVoice(BaseModel):
+class BrandVoice(FastBase):
     """Brand voice characteristics."""
-    tone: str = Field(default="", description="e.g., Professional, Friendly, Technical")
-    complexity_level: Optional[str] = Field(None, description="Simple, Moderate, Technical")
-    themes: List[str] = Field(default_factory=list)
-    key_themes: List[str] = Field(default_factory=list)
+    tone: str = ""  # e.g., Professional, Friendly, Technical
+    complexity_level: Optional[str] = None  # Simple, Moderate, Technical
+    key_themes: List[str] = Field(
+        default_factory=list,
+        validation_alias=AliasChoices("key_themes", "themes")
+    )
     taglines: List[str] = Field(default_factory=list)
     emotional_appeals: List[str] = Field(default_factory=list)
+    
+    # Deprecated alias of key_themes
+    @property
+    def themes(self) -> List[str]:
+        return self.key_themes
+    
+    @themes.setter
+    def themes(self, value: List[str]):
+        self.key_themes = value
 
 
-class CompanyProfile(BaseModel):
+class CompanyProfile(FastBase):
     """Complete company profile from research."""
     name: str
     website_url: str
@@ -114,7 +231,7 @@ class CompanyProfile(BaseModel):
     products_services: List[ProductService] = Field(default_factory=list)
     stated_value_propositions: List[str] = Field(default_factory=list)
     stated_target_audience: Optional[str] = None
-    brand_voice: Optional[Any] = None  # Can be BrandVoice or dict
+    brand_voice: Optional[BrandVoice] = None
     competitors: List[Competitor] = Field(default_factory=list)
     trust_signals: List[str] = Field(default_factory=list)
     content_themes: List[str] = Field(default_factory=list)
@@ -125,36 +242,65 @@ class CompanyProfile(BaseModel):
     vision_statement: Optional[str] = None
     core_values: List[str] = Field(default_factory=list)
     raw_research: Optional[str] = None
+    
+    @field_validator("brand_voice", mode="before")
+    @classmethod
+    def _coerce_brand_voice(cls, value):
+        """Accept a bare tone string; drop anything that isn't an object."""
+        if isinstance(value, str):
+            return {"tone": value}
+        if isinstance(value, (dict, BrandVoice)):
+            return value
+        return None
 
 
 # ===== ICP Models =====
 
-class Demographics(BaseModel):
+class Demographics(FastBase):
     """Demographics/Firmographics."""
     # B2B fields
     company_size: Optional[str] = None
-    annual_revenue: Optional[str] = None
+    annual_revenue: str = ""
     industry_verticals: List[str] = Field(default_factory=list)
-    company_stage: Optional[str] = None
-    department: Optional[str] = None
+    company_stage: str = ""
+    department: str = ""
     job_titles: List[str] = Field(default_factory=list)
     seniority_level: Optional[str] = None
     budget_range: Optional[str] = None
     
     # B2C fields
     age_range: Optional[str] = None
-    gender_skew: Optional[str] = None
-    income_bracket: Optional[str] = None
-    income_range: Optional[str] = None
+    gender_skew: str = ""
+    income_range: Optional[str] = Field(
+        None, validation_alias=AliasChoices("income_range", "income_bracket")
+    )
     education_level: Optional[str] = None
-    family_status: Optional[str] = None
-    location_type: Optional[str] = None
+    family_status: str = ""
+    location_type: str = ""
     
     # Common
     geographic_focus: Optional[str] = None
+    
+    # Deprecated alias of income_range
+    @property
+    def income_bracket(self) -> Optional[str]:
+        return self.income_range
+    
+    @income_bracket.setter
+    def income_bracket(self, value: Optional[str]):
+        self.income_range = value
+    
+    # Joined display strings (cached, shared across exporters)
+    @cached_property
+    def job_titles_csv(self) -> str:
+        return ", ".join(self.job_titles)
+    
+    @cached_property
+    def industry_verticals_csv(self) -> str:
+        return ", ".join(self.industry_verticals)
 
 
-class Psychographics(BaseModel):
+class Psychographics(FastBase):
     """Psychographic profile."""
     core_values: List[str] = Field(default_factory=list)
     aspirations: List[str] = Field(default_factory=list)
@@ -165,64 +311,129 @@ class Psychographics(BaseModel):
     lifestyle_priorities: List[str] = Field(default_factory=list)
     fears: List[str] = Field(default_factory=list)
     status_concerns: List[str] = Field(default_factory=list)
+    
+    # Joined display strings (cached, shared across exporters)
+    @cached_property
+    def core_values_csv(self) -> str:
+        return ", ".join(self.core_values)
+    
+    @cached_property
+    def aspirations_csv(self) -> str:
+        return ", ".join(self.aspirations)
+    
+    @cached_property
+    def fears_csv(self) -> str:
+        return ", ".join(self.fears)
 
 
-class BehavioralProfile(BaseModel):
+class BehavioralProfile(FastBase):
     """Behavioral characteristics."""
-    buying_process: Optional[str] = None
+    buying_process: str = ""
     research_channels: List[str] = Field(default_factory=list)
     decision_timeline: Optional[str] = None
-    decision_influencers: List[str] = Field(default_factory=list)
-    key_influencers: List[str] = Field(default_factory=list)
-    preferred_content_formats: List[str] = Field(default_factory=list)
-    content_preferences: List[str] = Field(default_factory=list)
-    engagement_patterns: Optional[str] = None
-    technology_adoption: Optional[str] = None
+    decision_influencers: List[str] = Field(
+        default_factory=list,
+        validation_alias=AliasChoices("decision_influencers", "key_influencers")
+    )
+    content_preferences: List[str] = Field(
+        default_factory=list,
+        validation_alias=AliasChoices(
+            "content_preferences", "preferred_content_formats"
+        )
+    )
+    engagement_patterns: str = ""
+    technology_adoption: str = ""
     current_solutions: List[str] = Field(default_factory=list)
     purchase_triggers: List[str] = Field(default_factory=list)
     objections: List[str] = Field(default_factory=list)
+    
+    # Deprecated aliases of decision_influencers / content_preferences
+    @property
+    def key_influencers(self) -> List[str]:
+        return self.decision_influencers
+    
+    @key_influencers.setter
+    def key_influencers(self, value: List[str]):
+        self.decision_influencers = value
+    
+    @property
+    def preferred_content_formats(self) -> List[str]:
+        return self.content_preferences
+    
+    @preferred_content_formats.setter
+    def preferred_content_formats(self, value: List[str]):
+        self.content_preferences = value
+    
+    # Joined display strings (cached, shared across exporters)
+    @cached_property
+    def research_channels_csv(self) -> str:
+        return ", ".join(self.research_channels)
+    
+    @cached_property
+    def content_preferences_csv(self) -> str:
+        return ", ".join(self.content_preferences)
+    
+    @cached_property
+    def current_solutions_csv(self) -> str:
+        return ", ".join(self.current_solutions)
 
 
-class Motivation(BaseModel):
+@dataclass(slots=True)
+class Motivation:
     """Customer motivation."""
     statement: str
-    type: Optional[str] = Field(None, description="Internal or External")
-    category: str = "functional"
-    intensity: int = Field(default=5, ge=1, le=10)
+    type: Optional[str] = None  # Internal or External
+    category: Label = "functional"
+    intensity: Score = 5
     trigger_event: Optional[str] = None
 
 
-class PainPoint(BaseModel):
+class PainPoint(FastBase):
     """Customer pain point."""
     statement: str
-    category: str = "functional"
+    category: Label = "functional"
     severity: int = Field(default=5, ge=1, le=10)
-    frequency: Optional[str] = None
-    current_workaround: Optional[str] = None
-    current_coping: Optional[str] = None
-    content_strategy: Optional[str] = None
+    frequency: Optional[Label] = None
+    current_coping: Optional[str] = Field(
+        None,
+        validation_alias=AliasChoices("current_coping", "current_workaround")
+    )
+    content_strategy: str = ""
+    
+    # Deprecated alias of current_coping
+    @property
+    def current_workaround(self) -> Optional[str]:
+        return self.current_coping
+    
+    @current_workaround.setter
+    def current_workaround(self, value: Optional[str]):
+        self.current_coping = value
 
 
-class Goal(BaseModel):
+@dataclass(slots=True)
+class Goal:
     """Customer goal."""
     statement: str
-    timeframe: str = Field(default="", description="Immediate or Long-term")
+    timeframe: str = ""  # Immediate or Long-term
     success_metric: Optional[str] = None
 
 
-class Fear(BaseModel):
+@dataclass(slots=True)
+class Fear:
     """Customer fear."""
     statement: str
     underlying_anxiety: Optional[str] = None
-    trigger_situations: List[str] = Field(default_factory=list)
+    trigger_situations: List[str] = field(default_factory=list)
 
 
-class IdealCustomerProfile(BaseModel):
+class IdealCustomerProfile(FastBase):
     """Complete Ideal Customer Profile."""
+    model_config = ConfigDict(frozen=True)
+    
     icp_id: Optional[str] = None
     icp_name: str
     one_liner: str = ""
-    segment_priority: str = Field(default="medium", description="Primary, Secondary, Niche, high, medium, low")
+    segment_priority: Label = "medium"  # Primary, Secondary, Niche, high, medium, low
     
     demographics: Demographics = Field(default_factory=Demographics)
     psychographics: Psychographics = Field(default_factory=Psychographics)
@@ -243,69 +454,76 @@ ICP = IdealCustomerProfile
 
 # ===== Value Proposition Models =====
 
-class CustomerJob(BaseModel):
+@dataclass(slots=True)
+class CustomerJob:
     """Customer job to be done."""
     statement: str
-    job_type: str = Field(default="", description="Functional, Social, or Emotional")
-    importance: str = Field(default="", description="Critical, Important, Nice-to-have")
-    frequency: Optional[str] = None
+    job_type: Label = ""  # Functional, Social, or Emotional
+    importance: str = ""  # Critical, Important, Nice-to-have
+    frequency: Optional[Label] = None
 
 
-class Pain(BaseModel):
+@dataclass(slots=True)
+class Pain:
     """Customer pain from VPC."""
     statement: str
-    severity: int = Field(default=5, ge=1, le=10)
-    pain_type: str = Field(default="", description="Functional, Financial, Emotional")
+    severity: Score = 5
+    pain_type: Label = ""  # Functional, Financial, Emotional
 
 
-class Gain(BaseModel):
+@dataclass(slots=True)
+class Gain:
     """Customer gain from VPC."""
     statement: str
-    gain_type: str = Field(default="", description="Required, Expected, Desired, Unexpected")
+    gain_type: Label = ""  # Required, Expected, Desired, Unexpected
     importance: str = ""
 
 
-class PainReliever(BaseModel):
+class PainReliever(FastBase):
     """How product relieves pain."""
     pain_addressed: str
     how_relieved: str
     feature_or_capability: str = ""
-    strength: str = Field(default="", description="Strong, Moderate, Weak")
+    strength: str = ""  # Strong, Moderate, Weak
     relief_significance: int = Field(default=5, ge=1, le=10)
-    evidence: Optional[str] = None
+    evidence: str = ""
 
 
-class GainCreator(BaseModel):
+class GainCreator(FastBase):
     """How product creates gain."""
     gain_created: str
     how_created: str
     feature_or_capability: str = ""
     strength: str = ""
     creation_significance: int = Field(default=5, ge=1, le=10)
-    evidence: Optional[str] = None
+    evidence: str = ""
 
 
-class ValuePropositionCanvas(BaseModel):
+class ValuePropositionCanvas(FastBase):
     """Complete Value Proposition Canvas."""
+    model_config = ConfigDict(frozen=True)
+    
     icp_id: Optional[str] = None
     icp_name: Optional[str] = None
     
     # Customer Profile side
-    customer_jobs: Any = Field(default_factory=dict)  # Can be dict or list
+    customer_jobs: List[CustomerJob] = Field(default_factory=list)
     pains: List[Pain] = Field(default_factory=list)
     gains: List[Gain] = Field(default_factory=list)
-    customer_pains: List[Any] = Field(default_factory=list)
-    customer_gains: List[Any] = Field(default_factory=list)
+    customer_pains: List[Union[Dict[str, Any], str]] = Field(default_factory=list)
+    customer_gains: List[Union[Dict[str, Any], str]] = Field(default_factory=list)
     
     # Value Map side
     products_services: List[str] = Field(default_factory=list)
-    products_services_fit: List[Any] = Field(default_factory=list)
+    products_services_fit: List[Union[Dict[str, Any], str]] = Field(
+        default_factory=list
+    )
     pain_relievers: List[PainReliever] = Field(default_factory=list)
     gain_creators: List[GainCreator] = Field(default_factory=list)
     
     # Fit analysis
-    fit_score: Optional[float] = Field(None, ge=0, le=100)
-    fit_analysis: Optional[str] = None
+    fit_score: float = Field(default=0.0, ge=0, le=100)
+    fit_analysis: str = ""
     unique_differentiators: List[str] = Field(default_factory=list)
     commodity_features: List[str] = Field(default_factory=list)
     gaps_weaknesses: List[str] = Field(default_factory=list)
@@ -313,16 +531,41 @@ class ValuePropositionCanvas(BaseModel):
     
     # Value proposition statement
     value_proposition_statement: Optional[str] = None
+    
+    @field_validator("customer_jobs", mode="before")
+    @classmethod
+    def _normalize_customer_jobs(cls, value):
+        """
+        Normalize jobs to a flat list of CustomerJob.
+        
+        The LLM returns {"functional": ["Job 1", ...], "social": [...]};
+        plain strings become statements tagged with their job type.
+        """
+        if not value:
+            return []
+        if isinstance(value, dict):
+            return [
+                {"statement": job, "job_type": job_type.title()}
+                if isinstance(job, str) else job
+                for job_type, jobs in value.items()
+                for job in (jobs if isinstance(jobs, list) else [jobs])
+            ]
+        if isinstance(value, list):
+            return [
+                {"statement": job} if isinstance(job, str) else job
+                for job in value
+            ]
+        return value
 
 
 # ===== Pain Point Taxonomy Models =====
 
-class DetailedPainPoint(BaseModel):
+class DetailedPainPoint(FastBase):
     """Detailed pain point with full context."""
     statement: str
-    category: str = "functional"
+    category: Label = "functional"
     severity: int = Field(default=5, ge=1, le=10)
-    frequency: Optional[str] = None
+    frequency: Optional[Label] = None
     current_coping_mechanism: Optional[str] = None
     impact_if_unresolved: Optional[str] = None
     root_cause: Optional[str] = None
@@ -330,54 +573,64 @@ class DetailedPainPoint(BaseModel):
     estimated_cost_impact: Optional[str] = None
     trigger_situations: List[str] = Field(default_factory=list)
     underlying_fear: Optional[str] = None
-    time_impact: Optional[str] = None
-    current_workaround: Optional[str] = None
-    content_strategy: Optional[str] = None
+    time_impact: str = ""
+    current_workaround: str = ""
+    content_strategy: str = ""
 
 
-class FunctionalPain(BaseModel):
+class FunctionalPain(FastBase):
     """Functional pain point."""
+    kind: Literal["functional"] = "functional"
     statement: str
-    category: str = "inefficiency"  # Inefficiency, Complexity, Inaccuracy, etc.
+    category: Label = "inefficiency"  # Inefficiency, Complexity, Inaccuracy, etc.
     severity: int = Field(default=5, ge=1, le=10)
-    frequency: Optional[str] = None
-    time_impact: Optional[str] = None
-    current_workaround: Optional[str] = None
+    frequency: Optional[Label] = None
+    time_impact: str = ""
+    current_workaround: str = ""
     current_coping_mechanism: Optional[str] = None
     impact_if_unresolved: Optional[str] = None
     root_cause: Optional[str] = None
     five_whys_depth: Optional[str] = None
-    content_strategy: Optional[str] = None
+    content_strategy: str = ""
 
 
-class FinancialPain(BaseModel):
+class FinancialPain(FastBase):
     """Financial pain point."""
+    kind: Literal["financial"] = "financial"
     statement: str
-    category: str = "direct_cost"  # Direct Cost, Hidden Costs, ROI Uncertainty, etc.
+    category: Label = "direct_cost"  # Direct Cost, Hidden Costs, ROI Uncertainty, etc.
     severity: int = Field(default=5, ge=1, le=10)
-    frequency: Optional[str] = None
-    impact: Optional[str] = None
+    frequency: Optional[Label] = None
+    impact: str = ""
     estimated_cost_impact: Optional[str] = None
     current_coping_mechanism: Optional[str] = None
     impact_if_unresolved: Optional[str] = None
     root_cause: Optional[str] = None
-    content_strategy: Optional[str] = None
+    content_strategy: str = ""
 
 
-class EmotionalPain(BaseModel):
+class EmotionalPain(FastBase):
     """Emotional pain point."""
+    kind: Literal["emotional"] = "emotional"
     statement: str
-    category: str = "anxiety"  # Anxiety, Frustration, Overwhelm, etc.
+    category: Label = "anxiety"  # Anxiety, Frustration, Overwhelm, etc.
     severity: int = Field(default=5, ge=1, le=10)
-    frequency: Optional[str] = None
+    frequency: Optional[Label] = None
     underlying_fear: Optional[str] = None
     trigger_situations: List[str] = Field(default_factory=list)
     current_coping_mechanism: Optional[str] = None
     impact_if_unresolved: Optional[str] = None
-    content_strategy: Optional[str] = None
+    content_strategy: str = ""
+
+
+# Any of the three pain types, dispatched on its "kind" tag
+TaxonomyPain = Annotated[
+    Union[FunctionalPain, FinancialPain, EmotionalPain],
+    Field(discriminator="kind")
+]
 
 
-class ForcesOfProgressAnalysis(BaseModel):
+class ForcesOfProgressAnalysis(FastBase):
     """Four Forces of Progress analysis."""
     push_factors: List[str] = Field(default_factory=list)
     pull_factors: List[str] = Field(default_factory=list)
@@ -392,7 +645,8 @@ class ForcesOfProgressAnalysis(BaseModel):
 ForcesAnalysis = ForcesOfProgressAnalysis
 
 
-class FiveWhysAnalysis(BaseModel):
+@dataclass(slots=True)
+class FiveWhysAnalysis:
     """Five Whys root cause analysis."""
     surface_pain: str
     why_1: str
@@ -403,37 +657,75 @@ class FiveWhysAnalysis(BaseModel):
     marketing_implication: Optional[str] = None
 
 
-class PainPointTaxonomy(BaseModel):
+class PainPointTaxonomy(FastBase):
     """Complete pain point taxonomy."""
+    # Frozen, so the derived views below are safe to cache per instance
+    model_config = ConfigDict(frozen=True)
+    
     icp_id: Optional[str] = None
     icp_name: Optional[str] = None
     
-    functional_pains: List[Any] = Field(default_factory=list)
-    financial_pains: List[Any] = Field(default_factory=list)
-    emotional_pains: List[Any] = Field(default_factory=list)
+    # Functional, financial and emotional pains in one tagged list
+    pains: List[TaxonomyPain] = Field(default_factory=list)
     
     forces_analysis: Optional[ForcesOfProgressAnalysis] = None
     five_whys_analyses: List[FiveWhysAnalysis] = Field(default_factory=list)
     
     switching_barriers: List[str] = Field(default_factory=list)
     switching_triggers: List[str] = Field(default_factory=list)
-    pain_priority_ranking: List[Any] = Field(default_factory=list)
+    pain_priority_ranking: List[Union[Dict[str, Any], str]] = Field(
+        default_factory=list
+    )
     messaging_implications: List[str] = Field(default_factory=list)
+    
+    @model_validator(mode="before")
+    @classmethod
+    def _merge_pain_lists(cls, data: Any) -> Any:
+        """Fold the older per-dimension pain lists into pains."""
+        if not isinstance(data, dict) or "pains" in data:
+            return data
+        legacy = [
+            (kind, data.get(f"{kind}_pains"))
+            for kind in ("functional", "financial", "emotional")
+        ]
+        if not any(pains for _, pains in legacy):
+            return data
+        data = dict(data)
+        data["pains"] = [
+            {**pain, "kind": kind} if isinstance(pain, dict) else pain
+            for kind, pains in legacy
+            for pain in pains or []
+        ]
+        return data
+    
+    @cached_property
+    def functional_pains(self) -> List[FunctionalPain]:
+        return [p for p in self.pains if p.kind == "functional"]
+    
+    @cached_property
+    def financial_pains(self) -> List[FinancialPain]:
+        return [p for p in self.pains if p.kind == "financial"]
+    
+    @cached_property
+    def emotional_pains(self) -> List[EmotionalPain]:
+        return [p for p in self.pains if p.kind == "emotional"]
 
 
 # ===== Journey Map Models =====
 
-class ContentIdea(BaseModel):
+@dataclass(slots=True)
+class ContentIdea:
     """Content idea for a journey stage."""
     title: str
-    format: str = "blog"
+    format: Label = "blog"
     hook: Optional[str] = None
-    key_points: List[str] = Field(default_factory=list)
+    key_points: List[str] = field(default_factory=list)
     key_message: Optional[str] = None
     cta: Optional[str] = None
 
 
-class AdCreative(BaseModel):
+@dataclass(slots=True)
+class AdCreative:
     """Ad creative direction."""
     angle: str
     headline: str
@@ -442,16 +734,16 @@ class AdCreative(BaseModel):
     cta: Optional[str] = None
 
 
-class JourneyStage(BaseModel):
+class JourneyStage(FastBase):
     """Single journey stage."""
-    stage_id: Optional[str] = None
-    stage_name: Optional[str] = None
+    stage_id: str = ""
+    stage_name: str = ""
     
     # Customer context
     objective: str = ""
-    customer_mindset: Optional[str] = None
-    knowledge_level: Optional[str] = None
-    emotional_state: List[str] = Field(default_factory=list)
+    customer_mindset: str = ""
+    knowledge_level: Optional[Label] = None
+    emotional_state: List[Label] = Field(default_factory=list)
     
     # Questions and needs
     key_questions: List[str] = Field(default_factory=list)
@@ -466,17 +758,31 @@ class JourneyStage(BaseModel):
     content_ideas: List[ContentIdea] = Field(default_factory=list)
     
     # Campaign recommendations
-    ad_campaign_angle: Optional[str] = None
+    ad_campaign_angle: str = ""
     ad_creatives: List[AdCreative] = Field(default_factory=list)
-    targeting_approach: Optional[str] = None
+    targeting_approach: str = ""
     targeting_criteria: List[str] = Field(default_factory=list)
     
     # Metrics
     kpis: List[str] = Field(default_factory=list)
-    stage_completion_signal: Optional[str] = None
+    stage_completion_signal: str = ""
+    
+    # Joined display strings (cached, shared across exporters)
+    @cached_property
+    def emotional_state_csv(self) -> str:
+        return ", ".join(self.emotional_state)
+    
+    @cached_property
+    def preferred_channels_csv(self) -> str:
+        return ", ".join(self.preferred_channels)
+    
+    @cached_property
+    def kpis_csv(self) -> str:
+        return ", ".join(self.kpis)
 
 
-class Touchpoint(BaseModel):
+@dataclass(slots=True)
+class Touchpoint:
     """Customer touchpoint."""
     sequence: int
     stage: str
@@ -486,8 +792,10 @@ class Touchpoint(BaseModel):
     trigger: Optional[str] = None
 
 
-class CustomerJourneyMap(BaseModel):
+class CustomerJourneyMap(FastBase):
     """Complete customer journey map."""
+    model_config = ConfigDict(frozen=True)
+    
     icp_id: Optional[str] = None
     icp_name: Optional[str] = None
     
@@ -503,12 +811,74 @@ class CustomerJourneyMap(BaseModel):
     key_decision_points: List[str] = Field(default_factory=list)
     touchpoint_sequence: List[Touchpoint] = Field(default_factory=list)
     cross_stage_recommendations: List[str] = Field(default_factory=list)
-    content_calendar_priorities: List[Any] = Field(default_factory=list)
+    content_calendar_priorities: List[Union[Dict[str, Any], str]] = Field(
+        default_factory=list
+    )
+
+
+# ===== Trusted Construction =====
+
+def _annotation_candidates(annotation) -> tuple:
+    """The annotation itself plus the members of a Union/Optional."""
+    if get_origin(annotation) is Annotated:
+        annotation = get_args(annotation)[0]
+    if get_origin(annotation) is Union:
+        return (annotation, *get_args(annotation))
+    return (annotation,)
+
+
+def _tag_matches(model_cls, data: Dict[str, Any]) -> bool:
+    """Whether data's Literal tag (e.g. a pain "kind") fits model_cls."""
+    for name, info in model_cls.model_fields.items():
+        if get_origin(info.annotation) is Literal and name in data:
+            return data[name] in get_args(info.annotation)
+    return True
+
+
+def _trusted_value(annotation, value):
+    """Rebuild nested models/enums inside a field value without validation."""
+    if isinstance(value, dict):
+        for candidate in _annotation_candidates(annotation):
+            if (
+                isinstance(candidate, type)
+                and issubclass(candidate, BaseModel)
+                and _tag_matches(candidate, value)
+            ):
+                return _trusted_model(candidate, value)
+            if isinstance(candidate, type) and is_dataclass(candidate):
+                return candidate(**value)
+    elif isinstance(value, list):
+        for candidate in _annotation_candidates(annotation):
+            if get_origin(candidate) is list:
+                (item_type,) = get_args(candidate)
+                return [_trusted_value(item_type, item) for item in value]
+    elif isinstance(value, str):
+        for candidate in _annotation_candidates(annotation):
+            if isinstance(candidate, type) and issubclass(candidate, Enum):
+                return candidate(value)
+            if candidate is bytes:
+                # JSON dumps bytes fields as UTF-8 text
+                return value.encode()
+    return value
+
+
+def _trusted_model(model_cls, data: Dict[str, Any]):
+    """
+    model_construct() a model and, bottom-up, all of its nested models.
+    
+    model_construct() itself does not recurse, so children are built first.
+    """
+    fields = model_cls.model_fields
+    return model_cls.model_construct(**{
+        name: _trusted_value(fields[name].annotation, value)
+        if name in fields else value
+        for name, value in data.items()
+    })
 
 
 # ===== Complete Research Results =====
 
-class ICPResearchResult(BaseModel):
+class ICPResearchResult(FastBase):
     """Complete research results for a single ICP."""
     icp: IdealCustomerProfile
     value_proposition: Optional[ValuePropositionCanvas] = None
@@ -520,17 +890,17 @@ class ICPResearchResult(BaseModel):
 ICPAnalysisResult = ICPResearchResult
 
 
-class ResearchResults(BaseModel):
+class ResearchResults(FastBase):
     """Complete research results for a client."""
     client_input: ClientInput
     company_profile: Optional[CompanyProfile] = None
     icps: List[ICPResearchResult] = Field(default_factory=list)
     
-    # Raw data storage
-    raw_research_data: Dict[str, Any] = Field(default_factory=dict)
+    # Raw data storage, kept as JSON bytes (see raw_research_data_parsed)
+    raw_research_data: bytes = b"{}"
     
-    # Metadata
-    created_at: datetime = Field(default_factory=datetime.now)
+    # Metadata (created_at is a Unix timestamp)
+    created_at: float = Field(default_factory=time.time)
     analysis_model: Optional[str] = None
     research_model: Optional[str] = None
     
@@ -541,15 +911,118 @@ class ResearchResults(BaseModel):
     
     # Error handling
     error: Optional[str] = None
+    
+    @field_validator("raw_research_data", mode="before")
+    @classmethod
+    def _encode_raw_research_data(cls, value: Any) -> Any:
+        """Store raw research dicts as JSON instead of validating them."""
+        if isinstance(value, dict):
+            return orjson.dumps(value)
+        return value
+    
+    @cached_property
+    def raw_research_data_parsed(self) -> Dict[str, Any]:
+        """The raw research data, decoded on first access."""
+        return orjson.loads(self.raw_research_data)
+    
+    @computed_field
+    @property
+    def created_at_iso(self) -> str:
+        """Local ISO-8601 timestamp for display."""
+        from datetime import datetime
+        return datetime.fromtimestamp(self.created_at).isoformat(
+            timespec="seconds"
+        )
+    
+    @classmethod
+    def from_trusted(
+        cls,
+        data: Dict[str, Any],
+        validate: bool = False
+    ) -> "ResearchResults":
+        """
+        Rebuild results from data that was already validated once, e.g. a
+        file written by save() (see load).
+        
+        Skips validation by constructing the whole tree with
+        model_construct(). Pass validate=True to fully validate instead
+        (use that for anything that did not come from this model).
+        """
+        if validate:
+            return cls.model_validate(data)
+        return _trusted_model(cls, data)
+    
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the results to disk as JSON (see load)."""
+        Path(path).write_bytes(self.to_bytes())
+    
+    @classmethod
+    def load(
+        cls,
+        path: Union[str, Path],
+        trusted: bool = False
+    ) -> "ResearchResults":
+        """
+        Read results written by save().
+        
+        The bytes go straight to pydantic-core's JSON validator, with no
+        intermediate dict. Pass trusted=True to skip validation for a file
+        known to come from save() (see from_trusted).
+        """
+        data = Path(path).read_bytes()
+        if trusted:
+            return cls.from_trusted(orjson.loads(data))
+        return cls.model_validate_json(data)
 
 
 # ===== Session State Model =====
 
-class SessionState(BaseModel):
+class SessionState(FastBase):
     """Session state for Streamlit."""
+    # Frozen snapshot of the submitted input
     client_input: Optional[ClientInput] = None
     results: Optional[ResearchResults] = None
     current_stage: Optional[str] = None
     stage_progress: Dict[str, str] = Field(default_factory=dict)
     error_message: Optional[str] = None
-    is_running: bool = False
\ No newline at end of file
+    is_running: bool = False
+
+
+# ===== List Parsing =====
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(item_type: type) -> TypeAdapter:
+    """One TypeAdapter per item type, created on first use."""
+    return TypeAdapter(List[item_type], config=ConfigDict(defer_build=True))
+
+
+def parse_list(item_type: Type[T], data: list) -> List[T]:
+    """
+    Validate a whole list of raw dicts into item_type in one call.
+    
+    e.g. parse_list(Motivation, raw["motivations"]). The list is looped in
+    pydantic-core rather than constructing each item from Python. The
+    module parsers use it for every list they build from LLM output; the
+    resulting instances are then passed to the parent model as-is (it does
+    not re-validate model or dataclass instances).
+    """
+    return _list_adapter(item_type).validate_python(data)
+
+
+# ===== Schema Build =====
+
+@lru_cache(maxsize=1)
+def build_schemas() -> None:
+    """
+    Build every model's core schema once, children before parents.
+    
+    Models are declared bottom-up, so rebuilding them in declaration order
+    means each parent references its already-built children's validators
+    and serializers instead of inlining its own copies. Called at the start
+    of a research run rather than at import, keeping cold starts cheap.
+    """
+    for model in FastBase.__subclasses__():
+        model.model_rebuild()
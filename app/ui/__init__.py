@@ -0,0 +1,7 @@
+"""
+Streamlit helpers shared by the app entry points.
+"""
+
+from app.ui.orchestrator_cache import get_orchestrator, checkout_orchestrator
+
+__all__ = ["get_orchestrator", "checkout_orchestrator"]
@@ -0,0 +1,78 @@
+"""
+Shared Orchestrator Cache
+=========================
+One ResearchOrchestrator per model/batch size, cached with
+st.cache_resource and checked out per run by both Streamlit entry points
+(app/main.py and streamlit_app.py).
+"""
+
+import contextlib
+import functools
+import threading
+from typing import Optional, TYPE_CHECKING
+
+import streamlit as st
+
+from app.config import APP_CONFIG
+
+if TYPE_CHECKING:
+    from app.llm.openrouter_client import CostTracker
+
+
+@functools.lru_cache(maxsize=1)
+def _load_orchestrator():
+    """
+    Import and return the ResearchOrchestrator class.
+    
+    Deferred so the landing page doesn't import the pipeline modules.
+    """
+    from app.core.orchestrator import ResearchOrchestrator
+    return ResearchOrchestrator
+
+
+@st.cache_resource(show_spinner=False)
+def get_orchestrator(analysis_model: str, batch_size: Optional[int] = None):
+    """
+    Build a ResearchOrchestrator once per model/batch size and reuse it
+    across runs. Returned with a lock that guards its cost tracker.
+    """
+    orchestrator = _load_orchestrator()(
+        analysis_model=analysis_model,
+        max_concurrency=APP_CONFIG["max_concurrency"],
+        batch_size=batch_size
+    )
+    return orchestrator, threading.Lock()
+
+
+@contextlib.contextmanager
+def checkout_orchestrator(
+    analysis_model: str,
+    cost_tracker: "CostTracker",
+    batch_size: Optional[int] = None,
+    use_cache: bool = True
+):
+    """
+    Yield the shared orchestrator bound to this session's cost tracker
+    and LLM cache setting.
+    
+    If another session is mid-run on the shared instance, a private one is
+    built instead so the two runs never log to each other's tracker.
+    """
+    orchestrator, lock = get_orchestrator(analysis_model, batch_size)
+    if not lock.acquire(blocking=False):
+        orchestrator = _load_orchestrator()(
+            analysis_model=analysis_model,
+            cost_tracker=cost_tracker,
+            max_concurrency=APP_CONFIG["max_concurrency"],
+            batch_size=batch_size
+        )
+        orchestrator.use_cache = use_cache
+        yield orchestrator
+        return
+    
+    try:
+        orchestrator.cost_tracker = cost_tracker
+        orchestrator.use_cache = use_cache
+        yield orchestrator
+    finally:
+        lock.release()
@@ -7,7 +7,10 @@ Run with: streamlit run streamlit_app.py
 """
 
 import streamlit as st
+import queue
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 # Add the app directory to the path for imports
@@ -18,8 +21,7 @@ from app.config import (
     ANALYSIS_MODELS,
     INDUSTRIES,
     BUSINESS_MODELS,
-    DEFAULT_ANALYSIS_MODEL,
-    PIPELINE_STAGES
+    DEFAULT_ANALYSIS_MODEL
 )
 from app.models.research_models import (
     ClientInput,
@@ -28,6 +30,18 @@ from app.models.research_models import (
     SessionState
 )
 from app.llm.openrouter_client import CostTracker
+from app.core.orchestrator import ResearchOrchestrator
+from app.ui import checkout_orchestrator
+
+# Exporters are optional (python-docx may be missing); resolved once here
+try:
+    from app.export.markdown_generator import generate_markdown
+except ImportError:
+    generate_markdown = None
+try:
+    from app.export.docx_generator import generate_docx
+except ImportError:
+    generate_docx = None
 
 
 # ===== Page Configuration =====
@@ -40,6 +54,31 @@ st.set_page_config(
 )
 
 
+# Static model choices for the sidebar selectbox
+_MODEL_OPTIONS = tuple(ANALYSIS_MODELS.keys())
+_DEFAULT_IDX = (
+    _MODEL_OPTIONS.index(DEFAULT_ANALYSIS_MODEL)
+    if DEFAULT_ANALYSIS_MODEL in _MODEL_OPTIONS else 0
+)
+
+# Business model radio label -> enum
+_BM_MAP = {
+    "B2B (Business to Business)": BusinessModelType.B2B,
+    "B2C (Business to Consumer)": BusinessModelType.B2C,
+    "Both B2B and B2C": BusinessModelType.BOTH
+}
+
+
+def _nz(value: str):
+    """Stripped text, or None if the field was left blank."""
+    return value.strip() if value and value.strip() else None
+
+
+def _bullets(items) -> str:
+    """Join items into one markdown bullet list (a single st.markdown element)."""
+    return "\n".join(f"- {item}" for item in items)
+
+
 # ===== Session State Initialization =====
 
 def init_session_state():
@@ -56,92 +95,128 @@ def init_session_state():
         st.session_state.current_stage = None
     if "stage_outputs" not in st.session_state:
         st.session_state.stage_outputs = {}
+    if "completed_count" not in st.session_state:
+        st.session_state.completed_count = 0
 
 
 # ===== Sidebar =====
 
 def render_sidebar():
-    """Render the sidebar with model selection and settings."""
+    """
+    Render the sidebar with model selection and settings.
+    
+    The choices are stored in st.session_state.selected_model,
+    st.session_state.num_icps and st.session_state.use_cache. Returns the
+    cost summary placeholder so it can be refilled after a research run.
+    """
     with st.sidebar:
-        st.title("🧠 Settings")
-        
-        st.markdown("---")
-        
-        # Model Selection
-        st.subheader("🤖 Analysis Model")
-        
-        model_options = list(ANALYSIS_MODELS.keys())
-        
-        selected_idx = 0
-        if DEFAULT_ANALYSIS_MODEL in model_options:
-            selected_idx = model_options.index(DEFAULT_ANALYSIS_MODEL)
-        
-        selected_model = st.selectbox(
-            "Select model for analysis:",
-            options=model_options,
-            format_func=lambda x: ANALYSIS_MODELS[x].name,
-            index=selected_idx,
-            help="Perplexity Sonar is always used for web research. "
-                 "This model handles the analysis."
-        )
-        
-        # Show model info
-        model_config = ANALYSIS_MODELS[selected_model]
-        st.caption(f"*{model_config.description}*")
-        st.caption(
-            f"💰 ${model_config.input_price_per_million}/M input, "
-            f"${model_config.output_price_per_million}/M output"
+        _sidebar_contents()
+        cost_slot = st.empty()
+        render_cost_summary(cost_slot)
+        _sidebar_footer()
+    return cost_slot
+
+
+@lru_cache(maxsize=len(ANALYSIS_MODELS))
+def _model_caption(model_key: str) -> tuple:
+    """Description and pricing captions for a model (static per model)."""
+    model_config = ANALYSIS_MODELS[model_key]
+    return (
+        f"*{model_config.description}*",
+        f"💰 ${model_config.input_price_per_million}/M input, "
+        f"${model_config.output_price_per_million}/M output"
+    )
+
+
+@st.fragment
+def _sidebar_contents():
+    """Sidebar settings; a fragment so its widgets rerun only this part."""
+    st.title("🧠 Settings")
+    
+    st.markdown("---")
+    
+    # Model Selection
+    st.subheader("🤖 Analysis Model")
+    
+    selected_model = st.selectbox(
+        "Select model for analysis:",
+        options=_MODEL_OPTIONS,
+        format_func=lambda x: ANALYSIS_MODELS[x].name,
+        index=_DEFAULT_IDX,
+        key="selected_model",
+        help="Perplexity Sonar is always used for web research. "
+             "This model handles the analysis."
+    )
+    
+    # Show model info
+    description, pricing = _model_caption(selected_model)
+    st.caption(description)
+    st.caption(pricing)
+    
+    st.markdown("---")
+    
+    # Number of ICPs
+    st.subheader("👥 ICP Settings")
+    st.slider(
+        "Number of ICPs to generate:",
+        min_value=APP_CONFIG["min_icps"],
+        max_value=APP_CONFIG["max_icps"],
+        value=APP_CONFIG["default_num_icps"],
+        key="num_icps",
+        help="Generate 2-5 Ideal Customer Profiles"
+    )
+    
+    st.toggle(
+        "Use LLM cache",
+        value=True,
+        key="use_cache",
+        help="Replay identical low-temperature LLM calls from the on-disk "
+             "cache instead of paying for them again"
+    )
+    
+    st.markdown("---")
+
+
+def render_cost_summary(slot):
+    """Fill the sidebar cost placeholder (only shown if there's usage)."""
+    if not st.session_state.cost_tracker.usage_log:
+        slot.empty()
+        return
+    
+    with slot.container():
+        st.subheader("💰 Cost Summary")
+        summary = st.session_state.cost_tracker.summary
+        st.metric(
+            "Total Cost",
+            f"${summary['total_cost']:.4f}"
         )
-        
-        st.markdown("---")
-        
-        # Number of ICPs
-        st.subheader("👥 ICP Settings")
-        num_icps = st.slider(
-            "Number of ICPs to generate:",
-            min_value=APP_CONFIG["min_icps"],
-            max_value=APP_CONFIG["max_icps"],
-            value=APP_CONFIG["default_num_icps"],
-            help="Generate 2-5 Ideal Customer Profiles"
+        st.metric(
+            "Total Tokens",
+            f"{summary['total_tokens']['total']:,}"
         )
         
-        st.markdown("---")
+        with st.expander("📊 Breakdown by Model"):
+            for model, data in summary['by_model'].items():
+                short_name = model.split('/')[-1]
+                st.write(f"**{short_name}**")
+                st.write(f"  Requests: {data['requests']}")
+                st.write(f"  Tokens: {data['total_tokens']:,}")
+                st.write(f"  Cost: ${data['cost']:.4f}")
         
-        # Cost Summary (only show if there's usage)
-        if st.session_state.cost_tracker.usage_log:
-            st.subheader("💰 Cost Summary")
-            summary = st.session_state.cost_tracker.get_summary()
-            st.metric(
-                "Total Cost",
-                f"${summary['total_cost']:.4f}"
-            )
-            st.metric(
-                "Total Tokens",
-                f"{summary['total_tokens']['total']:,}"
-            )
-            
-            with st.expander("📊 Breakdown by Model"):
-                for model, data in summary['by_model'].items():
-                    short_name = model.split('/')[-1]
-                    st.write(f"**{short_name}**")
-                    st.write(f"  Requests: {data['requests']}")
-                    st.write(f"  Tokens: {data['total_tokens']:,}")
-                    st.write(f"  Cost: ${data['cost']:.4f}")
-            
-            st.markdown("---")
-        
-        # Reset Button
-        if st.button("🔄 Reset Session", use_container_width=True):
-            for key in list(st.session_state.keys()):
-                del st.session_state[key]
-            st.rerun()
-        
-        # Info
         st.markdown("---")
-        st.caption(f"v{APP_CONFIG['version']}")
-        st.caption("Powered by OpenRouter")
-        
-        return selected_model, num_icps
+
+
+def _sidebar_footer():
+    """Reset button and version info below the cost summary."""
+    # Reset Button
+    if st.button("🔄 Reset Session", use_container_width=True):
+        st.session_state.clear()
+        st.rerun()
+    
+    # Info
+    st.markdown("---")
+    st.caption(f"v{APP_CONFIG['version']}")
+    st.caption("Powered by OpenRouter")
 
 
 # ===== Input Form =====
@@ -238,6 +313,9 @@ def render_input_form(num_icps: int):
         )
         
         if submitted:
+            client_name = _nz(client_name)
+            website_url = _nz(website_url)
+            
             # Validation
             errors = []
             if not client_name:
@@ -252,81 +330,28 @@ def render_input_form(num_icps: int):
                     st.error(f"❌ {error}")
                 return None
             
-            # Parse business model
-            bm_map = {
-                "B2B (Business to Business)": BusinessModelType.B2B,
-                "B2C (Business to Consumer)": BusinessModelType.B2C,
-                "Both B2B and B2C": BusinessModelType.BOTH
-            }
-            
-            # Parse additional URLs
+            # Parse additional URLs (one per line, blanks dropped)
             url_list = [
-                u.strip() for u in additional_urls.split('\n')
-                if u.strip()
+                u for u in map(str.strip, additional_urls.splitlines()) if u
             ]
             
             return ClientInput(
                 client_name=client_name,
                 website_url=website_url,
-                about_page_url=about_page_url if about_page_url else None,
-                products_services_url=products_url if products_url else None,
+                about_page_url=_nz(about_page_url),
+                products_services_url=_nz(products_url),
                 additional_urls=url_list,
                 industry=industry,
-                business_model=bm_map[business_model],
-                target_market=target_market if target_market else None,
-                known_competitors=known_competitors if known_competitors else None,
-                additional_context=additional_context if additional_context else None,
+                business_model=_BM_MAP[business_model],
+                target_market=_nz(target_market),
+                known_competitors=_nz(known_competitors),
+                additional_context=_nz(additional_context),
                 num_icps=num_icps
             )
     
     return None
 
 
-# ===== Progress Display =====
-
-def render_progress():
-    """Render the research progress."""
-    if not st.session_state.is_running:
-        return
-    
-    st.header("🔄 Research in Progress")
-    st.info("Please wait while we analyze your client's audience...")
-    
-    progress_bar = st.progress(0)
-    status_container = st.empty()
-    
-    # Calculate progress
-    total_stages = len(PIPELINE_STAGES)
-    completed = sum(
-        1 for stage in PIPELINE_STAGES
-        if st.session_state.stage_outputs.get(
-            stage["id"], {}
-        ).get("status") == "complete"
-    )
-    progress = completed / total_stages
-    progress_bar.progress(progress)
-    
-    # Show stage status
-    with status_container.container():
-        for stage in PIPELINE_STAGES:
-            stage_id = stage["id"]
-            status = st.session_state.stage_outputs.get(
-                stage_id, {}
-            ).get("status", "pending")
-            
-            if status == "running":
-                st.info(f"⏳ **{stage['name']}**: {stage['description']}...")
-            elif status == "complete":
-                st.success(f"✅ **{stage['name']}**: Complete")
-            elif status == "error":
-                error_msg = st.session_state.stage_outputs.get(
-                    stage_id, {}
-                ).get("error", "Unknown error")
-                st.error(f"❌ **{stage['name']}**: {error_msg}")
-            else:
-                st.write(f"⬜ **{stage['name']}**: Pending")
-
-
 # ===== Results Display =====
 
 def render_results():
@@ -350,7 +375,8 @@ def render_results():
             f"✅ Research complete for **{results.client_input.client_name}**"
         )
     
-    # Tabs for different sections
+    # Tabs for different sections; each tab body is a fragment so
+    # interacting inside one tab only reruns that tab
     tabs = st.tabs([
         "🏢 Company",
         "👥 ICPs",
@@ -385,6 +411,7 @@ def render_results():
         render_export(results)
 
 
+@st.fragment
 def render_company_profile(results: ResearchResults):
     """Render company profile section."""
     if not results.company_profile:
@@ -412,17 +439,14 @@ def render_company_profile(results: ResearchResults):
                 st.write(ps.description)
                 if ps.features:
                     st.write("**Features:**")
-                    for f in ps.features:
-                        st.write(f"• {f}")
+                    st.markdown(_bullets(ps.features))
                 if ps.unique_aspects:
                     st.write("**Unique Aspects:**")
-                    for u in ps.unique_aspects:
-                        st.write(f"• {u}")
+                    st.markdown(_bullets(ps.unique_aspects))
     
     if profile.stated_value_propositions:
         st.markdown("### 💡 Stated Value Propositions")
-        for vp in profile.stated_value_propositions:
-            st.write(f"• {vp}")
+        st.markdown(_bullets(profile.stated_value_propositions))
     
     if profile.competitors:
         st.markdown("### 🎯 Competitive Landscape")
@@ -432,10 +456,10 @@ def render_company_profile(results: ResearchResults):
                     st.write(comp.description)
                 if comp.key_differentiators:
                     st.write("**Differentiators:**")
-                    for d in comp.key_differentiators:
-                        st.write(f"• {d}")
+                    st.markdown(_bullets(comp.key_differentiators))
 
 
+@st.fragment
 def render_icps(results: ResearchResults):
     """Render ICPs section."""
     if not results.icps:
@@ -455,12 +479,18 @@ def render_icps(results: ResearchResults):
             
             with col1:
                 st.markdown("##### Demographics")
-                if icp.demographics.company_size:
-                    st.write(f"**Size:** {icp.demographics.company_size}")
-                if icp.demographics.job_titles:
-                    st.write(f"**Titles:** {', '.join(icp.demographics.job_titles[:3])}")
-                if icp.demographics.industry_verticals:
-                    st.write(f"**Industries:** {', '.join(icp.demographics.industry_verticals[:3])}")
+                demo = icp.demographics
+                rows = [
+                    {"Field": field, "Value": value}
+                    for field, value in (
+                        ("Size", demo.company_size),
+                        ("Titles", ", ".join(demo.job_titles[:3])),
+                        ("Industries", ", ".join(demo.industry_verticals[:3]))
+                    )
+                    if value
+                ]
+                if rows:
+                    st.dataframe(rows, hide_index=True, use_container_width=True)
             
             with col2:
                 st.markdown("##### Psychographics")
@@ -485,20 +515,26 @@ def render_icps(results: ResearchResults):
             with col1:
                 if icp.motivations:
                     st.markdown("##### 🎯 Motivations")
-                    for m in icp.motivations[:5]:
-                        st.write(f"• {m.statement}")
+                    st.markdown(_bullets(m.statement for m in icp.motivations[:5]))
             
             with col2:
                 if icp.pain_points:
                     st.markdown("##### 😰 Pain Points")
-                    for p in icp.pain_points[:5]:
-                        st.write(f"• {p.statement} ({p.severity}/10)")
+                    st.dataframe(
+                        [
+                            {"Pain": p.statement, "Severity": p.severity}
+                            for p in icp.pain_points[:5]
+                        ],
+                        hide_index=True,
+                        use_container_width=True
+                    )
             
             if icp.detailed_narrative:
                 st.markdown("##### 📖 Detailed Profile")
                 st.write(icp.detailed_narrative)
 
 
+@st.fragment
 def render_value_propositions(results: ResearchResults):
     """Render value propositions section."""
     if not results.icps:
@@ -527,29 +563,101 @@ def render_value_propositions(results: ResearchResults):
             
             with col1:
                 st.markdown("##### Pain Relievers")
-                for pr in vp.pain_relievers[:5]:
-                    st.write(f"**{pr.pain_addressed}**")
-                    st.write(f"  → {pr.how_relieved}")
+                st.markdown("\n\n".join(
+                    f"**{pr.pain_addressed}**  \n→ {pr.how_relieved}"
+                    for pr in vp.pain_relievers[:5]
+                ))
             
             with col2:
                 st.markdown("##### Gain Creators")
-                for gc in vp.gain_creators[:5]:
-                    st.write(f"**{gc.gain_created}**")
-                    st.write(f"  → {gc.how_created}")
+                st.markdown("\n\n".join(
+                    f"**{gc.gain_created}**  \n→ {gc.how_created}"
+                    for gc in vp.gain_creators[:5]
+                ))
             
             if vp.unique_differentiators:
                 st.markdown("##### 🌟 Unique Differentiators")
-                for d in vp.unique_differentiators:
-                    st.write(f"• {d}")
+                st.markdown(_bullets(vp.unique_differentiators))
+
 
+def _section(title: str, items) -> str:
+    """Bold title plus bullet list as one markdown block (empty if no items)."""
+    return f"{title}\n\n{_bullets(items)}" if items else ""
 
+
+def _section_markdown(results, key: tuple, build, section):
+    """
+    Markdown for one bullet-heavy section, built once per session.
+    
+    The strings are memoized in st.session_state by the section's position
+    (key), so reruns just replay them. The memo is dropped as soon as a
+    different results object is rendered (a new run or a reset).
+    """
+    memo = st.session_state.get("section_markdown")
+    if memo is None or memo[0] is not results:
+        memo = st.session_state.section_markdown = (results, {})
+    strings = memo[1]
+    if key not in strings:
+        strings[key] = build(section)
+    return strings[key]
+
+
+def _forces_markdown(fa) -> tuple:
+    """(left, right) column markdown for a Forces of Progress analysis."""
+    left = "\n\n".join(filter(None, (
+        _section("**Push Factors** (away from status quo)", fa.push_factors[:3]),
+        _section("**Pull Factors** (toward new solution)", fa.pull_factors[:3])
+    )))
+    right = "\n\n".join(filter(None, (
+        _section("**Habit Factors** (inertia)", fa.habit_factors[:3]),
+        _section("**Anxiety Factors** (fear of change)", fa.anxiety_factors[:3])
+    )))
+    return left, right
+
+
+def _journey_stage_markdown(stage) -> tuple:
+    """(header, left, right, ideas) markdown for one journey stage."""
+    header = f"**Objective:** {stage.objective}"
+    if stage.emotional_state:
+        header += f"\n\n**Emotional State:** {', '.join(stage.emotional_state)}"
+    
+    left = "\n\n".join(filter(None, (
+        _section("**Key Questions:**", stage.key_questions[:5]),
+        _section("**Content Themes:**", stage.content_themes[:5])
+    )))
+    right = "\n\n".join(filter(None, (
+        _section("**Preferred Channels:**", stage.preferred_channels[:5]),
+        _section("**KPIs:**", stage.kpis[:5])
+    )))
+    ideas = _section("**Content Ideas:**", [
+        f"**{idea.title}** ({idea.format})"
+        + (f"  \n  *Hook: {idea.hook}*" if idea.hook else "")
+        for idea in stage.content_ideas[:5]
+    ])
+    return header, left, right, ideas
+
+
+def _pain_table(pains):
+    """Render pains as one table (a single Arrow element)."""
+    if pains:
+        st.dataframe(
+            [
+                {"Pain": p.statement, "Severity": p.severity, "Category": p.category}
+                for p in pains
+            ],
+            hide_index=True,
+            use_container_width=True
+        )
+
+
+@st.fragment
 def render_pain_points(results: ResearchResults):
     """Render pain points section."""
     if not results.icps:
         st.info("Pain points not available.")
         return
     
-    for icp_result in results.icps:
+    for i, icp_result in enumerate(results.icps):
         if not icp_result.pain_taxonomy:
             continue
         
@@ -563,21 +671,15 @@ def render_pain_points(results: ResearchResults):
             
             with col1:
                 st.markdown("##### ⚙️ Functional")
-                for p in pt.functional_pains[:5]:
-                    st.write(f"• {p.statement}")
-                    st.caption(f"  Severity: {p.severity}/10 | {p.category}")
+                _pain_table(pt.functional_pains[:5])
             
             with col2:
                 st.markdown("##### 💰 Financial")
-                for p in pt.financial_pains[:5]:
-                    st.write(f"• {p.statement}")
-                    st.caption(f"  Severity: {p.severity}/10 | {p.category}")
+                _pain_table(pt.financial_pains[:5])
             
             with col3:
                 st.markdown("##### 💔 Emotional")
-                for p in pt.emotional_pains[:5]:
-                    st.write(f"• {p.statement}")
-                    st.caption(f"  Severity: {p.severity}/10 | {p.category}")
+                _pain_table(pt.emotional_pains[:5])
             
             if pt.forces_analysis:
                 st.markdown("---")
@@ -585,25 +687,13 @@ def render_pain_points(results: ResearchResults):
                 
                 fa = pt.forces_analysis
                 
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.markdown("**Push Factors** (away from status quo)")
-                    for f in fa.push_factors[:3]:
-                        st.write(f"• {f}")
-                    
-                    st.markdown("**Pull Factors** (toward new solution)")
-                    for f in fa.pull_factors[:3]:
-                        st.write(f"• {f}")
+                left, right = _section_markdown(
+                    results, ("forces", i), _forces_markdown, fa
+                )
                 
-                with col2:
-                    st.markdown("**Habit Factors** (inertia)")
-                    for f in fa.habit_factors[:3]:
-                        st.write(f"• {f}")
-                    
-                    st.markdown("**Anxiety Factors** (fear of change)")
-                    for f in fa.anxiety_factors[:3]:
-                        st.write(f"• {f}")
+                col1, col2 = st.columns(2)
+                col1.markdown(left)
+                col2.markdown(right)
                 
                 if fa.net_force_assessment:
                     st.info(f"**Assessment:** {fa.net_force_assessment}")
@@ -611,13 +701,14 @@ def render_pain_points(results: ResearchResults):
                     st.success(f"**Recommended Focus:** {fa.recommended_focus}")
 
 
+@st.fragment
 def render_journey_maps(results: ResearchResults):
     """Render journey maps section."""
     if not results.icps:
         st.info("Journey maps not available.")
         return
     
-    for icp_result in results.icps:
+    for i, icp_result in enumerate(results.icps):
         if not icp_result.journey_map:
             continue
         
@@ -645,46 +736,33 @@ def render_journey_maps(results: ResearchResults):
                 [(n, s) for n, s in stages if s]
             ):
                 with tab:
-                    st.markdown(f"**Objective:** {stage.objective}")
-                    
-                    if stage.emotional_state:
-                        st.write(
-                            f"**Emotional State:** "
-                            f"{', '.join(stage.emotional_state)}"
-                        )
+                    header, left, right, ideas = _section_markdown(
+                        results, ("journey", i, stage_name),
+                        _journey_stage_markdown, stage
+                    )
+                    st.markdown(header)
                     
                     col1, col2 = st.columns(2)
+                    col1.markdown(left)
+                    col2.markdown(right)
                     
-                    with col1:
-                        if stage.key_questions:
-                            st.markdown("**Key Questions:**")
-                            for q in stage.key_questions[:5]:
-                                st.write(f"• {q}")
-                        
-                        if stage.content_themes:
-                            st.markdown("**Content Themes:**")
-                            for t in stage.content_themes[:5]:
-                                st.write(f"• {t}")
-                    
-                    with col2:
-                        if stage.preferred_channels:
-                            st.markdown("**Preferred Channels:**")
-                            for c in stage.preferred_channels[:5]:
-                                st.write(f"• {c}")
-                        
-                        if stage.kpis:
-                            st.markdown("**KPIs:**")
-                            for k in stage.kpis[:5]:
-                                st.write(f"• {k}")
-                    
-                    if stage.content_ideas:
-                        st.markdown("**Content Ideas:**")
-                        for idea in stage.content_ideas[:5]:
-                            st.write(f"• **{idea.title}** ({idea.format})")
-                            if idea.hook:
-                                st.caption(f"  Hook: {idea.hook}")
+                    if ideas:
+                        st.markdown(ideas)
+
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60)
+def _export_markdown(results_json: bytes, _results: ResearchResults) -> str:
+    """Markdown report, memoized on the serialized results."""
+    return generate_markdown(_results)
 
 
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60)
+def _export_docx(results_json: bytes, _results: ResearchResults) -> bytes:
+    """DOCX report, memoized on the serialized results."""
+    return generate_docx(_results)
+
+
+@st.fragment
 def render_export(results: ResearchResults):
     """Render export section."""
     st.subheader("📥 Export Research Results")
@@ -693,15 +771,16 @@ def render_export(results: ResearchResults):
         "Download your research results in your preferred format."
     )
     
+    results_json = results.to_bytes()
+    
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("### 📝 Markdown")
         st.write("Best for documentation, GitHub, Notion, etc.")
         
-        try:
-            from app.export.markdown_generator import generate_markdown
-            md_content = generate_markdown(results)
+        if generate_markdown:
+            md_content = _export_markdown(results_json, results)
             
             st.download_button(
                 "📥 Download Markdown",
@@ -710,16 +789,15 @@ def render_export(results: ResearchResults):
                 mime="text/markdown",
                 use_container_width=True
             )
-        except ImportError:
+        else:
             st.warning("Markdown export module not available yet.")
     
     with col2:
         st.markdown("### 📄 DOCX")
         st.write("Best for Word, Google Docs, presentations.")
         
-        try:
-            from app.export.docx_generator import generate_docx
-            docx_bytes = generate_docx(results)
+        if generate_docx:
+            docx_bytes = _export_docx(results_json, results)
             
             st.download_button(
                 "📥 Download DOCX",
@@ -729,14 +807,14 @@ def render_export(results: ResearchResults):
                      ".wordprocessingml.document",
                 use_container_width=True
             )
-        except ImportError:
+        else:
             st.warning("DOCX export module not available yet.")
     
     st.markdown("---")
     
     # Cost summary
     st.subheader("💰 Session Cost Summary")
-    summary = st.session_state.cost_tracker.get_summary()
+    summary = st.session_state.cost_tracker.summary
     
     col1, col2, col3, col4 = st.columns(4)
     col1.metric("Total Cost", f"${summary['total_cost']:.4f}")
@@ -747,18 +825,49 @@ def render_export(results: ResearchResults):
 
 # ===== Run Research =====
 
-def run_research(client_input: ClientInput, selected_model: str):
+def _stream_research(orchestrator: ResearchOrchestrator, client_input: ClientInput):
+    """
+    Run the pipeline in a worker thread, yielding each progress update
+    (stage_id, status, data, error) as it arrives and the ResearchResults last.
+    
+    The orchestrator reports progress from its worker threads, which can't
+    touch st.* or session_state; updates are queued and yielded here on the
+    script thread so each stage renders as soon as it finishes.
+    """
+    updates: queue.Queue = queue.Queue()
+    
+    def progress_callback(stage_id: str, status: str, data=None, error=None):
+        updates.put((stage_id, status, data, error))
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(
+            orchestrator.run_research,
+            client_input,
+            progress_callback=progress_callback
+        )
+        while not (future.done() and updates.empty()):
+            try:
+                yield updates.get(timeout=0.1)
+            except queue.Empty:
+                pass
+    
+    yield future.result()
+
+
+def run_research(
+    client_input: ClientInput,
+    selected_model: str,
+    use_cache: bool = True
+):
     """Run the research pipeline with real-time progress display."""
     st.session_state.is_running = True
     st.session_state.stage_outputs = {}
+    st.session_state.completed_count = 0
 
     try:
-        from app.core.orchestrator import ResearchOrchestrator
-
         # Calculate total steps: 2 base stages + 3 stages per ICP
         num_icps = client_input.num_icps
         total_steps = 2 + (num_icps * 3)  # data_ingestion, audience_research + (usp, pain, journey) per ICP
-        completed_steps = 0
 
         # Create status container for real-time updates
         status_container = st.status(
@@ -781,10 +890,8 @@ def run_research(client_input: ClientInput, selected_model: str):
             "journey_mapping": ("🗺️ Journey Mapping", "Creating customer journey maps...")
         }
 
-        # Progress callback with real-time UI updates
-        def progress_callback(stage_id: str, status: str, data=None, error=None):
-            nonlocal completed_steps
-
+        # Applies one progress update to the UI (script thread only)
+        def show_progress(stage_id: str, status: str, data=None, error=None):
             if stage_id not in st.session_state.stage_outputs:
                 st.session_state.stage_outputs[stage_id] = {}
             st.session_state.stage_outputs[stage_id]["status"] = status
@@ -819,7 +926,8 @@ def run_research(client_input: ClientInput, selected_model: str):
                 stage_details.caption(stage_desc)
 
             elif status == "complete":
-                completed_steps += 1
+                st.session_state.completed_count += 1
+                completed_steps = st.session_state.completed_count
                 progress_pct = completed_steps / total_steps
                 progress_bar.progress(progress_pct, text=f"Step {completed_steps} of {total_steps} complete")
                 stage_text.markdown(f"✅ **{stage_title}** - Complete")
@@ -833,17 +941,14 @@ def run_research(client_input: ClientInput, selected_model: str):
                 stage_text.markdown(f"⚠️ **{stage_title}** - Error")
                 stage_details.caption(f"Error: {error}")
 
-        # Create orchestrator
-        orchestrator = ResearchOrchestrator(
-            analysis_model=selected_model,
-            cost_tracker=st.session_state.cost_tracker
-        )
-
-        # Run research
-        results = orchestrator.run_research(
-            client_input,
-            progress_callback=progress_callback
-        )
+        with checkout_orchestrator(
+            selected_model, st.session_state.cost_tracker, use_cache=use_cache
+        ) as orchestrator:
+            for item in _stream_research(orchestrator, client_input):
+                if isinstance(item, ResearchResults):
+                    results = item
+                else:
+                    show_progress(*item)
 
         # Final status update
         status_container.update(
@@ -854,26 +959,40 @@ def run_research(client_input: ClientInput, selected_model: str):
         progress_bar.progress(1.0, text="All steps complete!")
 
         st.session_state.results = results
-        st.session_state.is_running = False
 
         return True
 
     except Exception as e:
-        st.session_state.is_running = False
         if 'status_container' in locals():
             status_container.update(label=f"❌ Research failed", state="error")
         st.error(f"❌ Research failed: {str(e)}")
         return False
 
+    finally:
+        # Also runs when Streamlit stops or reruns the script mid-research
+        # (those exceptions bypass the handler above)
+        st.session_state.is_running = False
+
 
 # ===== Main Function =====
 
+def render_results_view():
+    """Render the results followed by the new-research button."""
+    render_results()
+    
+    st.markdown("---")
+    if st.button("🔄 Start New Research", use_container_width=True):
+        st.session_state.results = None
+        st.session_state.stage_outputs = {}
+        st.rerun()
+
+
 def main():
     """Main application entry point."""
     init_session_state()
     
     # Sidebar
-    selected_model, num_icps = render_sidebar()
+    cost_slot = render_sidebar()
     
     # Header
     st.title("🧠 Cognitive Resonance Engine")
@@ -884,29 +1003,30 @@ def main():
     
     # Show results if available
     if st.session_state.results:
-        render_results()
-        
-        st.markdown("---")
-        if st.button("🔄 Start New Research", use_container_width=True):
-            st.session_state.results = None
-            st.session_state.stage_outputs = {}
-            st.rerun()
-    
-    # Show progress if running
-    elif st.session_state.is_running:
-        render_progress()
+        render_results_view()
     
     # Show input form
     else:
-        client_input = render_input_form(num_icps)
+        form_slot = st.empty()
+        with form_slot.container():
+            client_input = render_input_form(st.session_state.num_icps)
 
         if client_input:
             st.session_state.session.client_input = client_input
-
-            # Run research with built-in progress display
-            success = run_research(client_input, selected_model)
-            if success:
-                st.rerun()
+            form_slot.empty()
+
+            # Run research with built-in progress display, then render the
+            # results in this same run instead of rerunning the whole script.
+            # The sidebar was drawn before any usage was logged, so refill
+            # its cost summary here.
+            succeeded = run_research(
+                client_input,
+                st.session_state.selected_model,
+                st.session_state.use_cache
+            )
+            render_cost_summary(cost_slot)
+            if succeeded:
+                render_results_view()
 
 
 if __name__ == "__main__":